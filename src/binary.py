@@ -0,0 +1,142 @@
+import os
+import mmap
+import struct
+
+from array import array
+
+import toMC
+
+from ir import Op, Instruction, Placeholder, Program, PLACEHOLDER, ARITY, direct, immediate, indirect, code, label
+
+MAGIC = b'TAC\0'
+VERSION = 2
+VERSIONS = (1, VERSION)
+
+HEADER = struct.Struct('<4sHHI5i')
+RECORD = struct.Struct('<BBHiii')
+
+LAYOUT = (
+    toMC.MACHINE_PARAMETER, toMC.MACHINE_FUN_INDEX, toMC.MACHINE_CONTAINER,
+    toMC.MACHINE_WORD_SIZE, toMC.COUNTER_REGISTER0
+)
+
+NONE = 7
+KINDS = (Placeholder.SAVED, Placeholder.BREAK, Placeholder.RETURN)
+TABLES = (direct, immediate, indirect, code, label)
+
+
+class FormatError(ValueError):
+    pass
+
+
+def pack(op, a, b, c):
+    if op == PLACEHOLDER:
+        return RECORD.pack(PLACEHOLDER, 0, 0, KINDS.index(a.kind), 0, 0)
+
+    modes, values = 0, [0, 0, 0]
+    for index, operand in enumerate((a, b, c)[:ARITY[op]]):
+        mode = NONE if operand is None else operand.mode
+        modes |= mode << 3 * index
+        values[index] = 0 if operand is None else operand.value
+
+    try:
+        return RECORD.pack(op, 0, modes, *values)
+    except struct.error:
+        raise FormatError(F'{Instruction(Op(op), a, b, c)} does not fit a 32 bit record') from None
+
+
+def dumps(program):
+    operands = program.operands
+    records = map(pack, program.ops, operands[0::3], operands[1::3], operands[2::3])
+    return HEADER.pack(MAGIC, VERSION, RECORD.size, len(program), *LAYOUT) + b''.join(records)
+
+
+def dump(program, path):
+    temp = F'{path}.{os.getpid()}.tmp'
+    with open(temp, 'wb') as f:
+        f.write(dumps(program))
+    os.replace(temp, path)
+
+
+class ObjectFile:
+
+    def __init__(self, buffer, source=None):
+        self.source, self.mapping = source, buffer
+        self.buffer = memoryview(buffer)
+
+        if len(self.buffer) < HEADER.size:
+            raise FormatError(F'{source or "object"}: truncated header')
+
+        magic, version, size, self.count, *self.layout = HEADER.unpack_from(self.buffer)
+        if magic != MAGIC:
+            raise FormatError(F'{source or "object"}: not a three address object')
+
+        if version not in VERSIONS or size != RECORD.size:
+            raise FormatError(F'{source or "object"}: version {version} with {size} byte records is not supported')
+
+        self.records = self.buffer[HEADER.size:HEADER.size + self.count * RECORD.size]
+        if len(self.records) != self.count * RECORD.size:
+            raise FormatError(F'{source or "object"}: expected {self.count} instructions')
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, index):
+        if not 0 <= index < self.count:
+            raise IndexError(index)
+
+        op, _, modes, *values = RECORD.unpack_from(self.records, index * RECORD.size)
+        if op == PLACEHOLDER:
+            return Placeholder(KINDS[values[0]])
+
+        operands = [
+            None if (modes >> 3 * i) & 7 == NONE else TABLES[(modes >> 3 * i) & 7][values[i]]
+            for i in range(ARITY[op])
+        ]
+        return Instruction(Op(op), *operands)
+
+    def __iter__(self):
+        return map(self.__getitem__, range(self.count))
+
+    def program(self):
+        program = Program()
+        program.ops = array('B', self.records[0::RECORD.size])
+        words, halves, operands = self.records.cast('i'), self.records.cast('H'), program.operands
+        shapes = {}
+
+        for op, modes, a, b, c in zip(program.ops, halves[1::8], words[1::4], words[2::4], words[3::4]):
+            if op == PLACEHOLDER:
+                operands += (Placeholder(KINDS[a]), None, None)
+                continue
+
+            shape = shapes.get(op << 16 | modes)
+            if shape is None:
+                shape = shapes[op << 16 | modes] = tuple(
+                    None if index >= ARITY[op] or (modes >> 3 * index) & 7 == NONE else
+                    TABLES[(modes >> 3 * index) & 7] for index in range(3)
+                )
+
+            x, y, z = shape
+            operands += (None if x is None else x[a], None if y is None else y[b], None if z is None else z[c])
+
+        return program
+
+    def close(self):
+        self.records.release()
+        self.buffer.release()
+
+        if isinstance(self.mapping, mmap.mmap):
+            self.mapping.close()
+
+
+def load(path):
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            raise FormatError(F'{path}: empty file')
+
+        return ObjectFile(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ), path)
+
+
+def is_object(path):
+    with open(path, 'rb') as f:
+        return f.read(len(MAGIC)) == MAGIC
@@ -0,0 +1,148 @@
+import os
+import json
+import hashlib
+
+import toMC
+import tablegen
+from compiler import CompileResult, compile_source
+from peephole import PATTERNS
+
+VERSION = 2
+MAX_BYTES = 256 << 20
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+SERVING = ('cache.py', 'server.py')
+SOURCES = tuple(
+    sorted(name for name in os.listdir(HERE) if name.endswith('.py') and name not in SERVING)
+) + ('grammar.txt', 'actions.txt')
+LAYOUT = (
+    toMC.MACHINE_PARAMETER, toMC.MACHINE_FUN_INDEX, toMC.MACHINE_CONTAINER,
+    toMC.MACHINE_WORD_SIZE, toMC.COUNTER_REGISTER0
+)
+
+
+def compiler_version():
+    digest = hashlib.sha256(F'{VERSION} {tablegen.VERSION} {LAYOUT}'.encode('utf-8'))
+
+    for name in SOURCES:
+        with open(os.path.join(HERE, name), 'rb') as f:
+            digest.update(f.read())
+
+    return digest.hexdigest()
+
+
+class Cache:
+    version = None
+    instances = {}
+
+    @classmethod
+    def shared(cls, directory):
+        if directory not in cls.instances:
+            cls.instances[directory] = cls(directory)
+
+        return cls.instances[directory]
+
+    def __init__(self, directory, max_bytes=MAX_BYTES):
+        self.directory, self.max_bytes = directory, max_bytes
+        self.hits = self.misses = self.stores = self.evictions = 0
+
+        if Cache.version is None:
+            Cache.version = compiler_version()
+
+        os.makedirs(directory, exist_ok=True)
+        self.size = sum(size for _, size, _ in self.entries())
+
+    def key(self, source, max_errors=None, peephole=PATTERNS):
+        if isinstance(source, str):
+            source = source.encode('utf-8')
+
+        digest = hashlib.sha256(F'{self.version} {max_errors} {sorted(peephole)}\0'.encode('utf-8'))
+        digest.update(source)
+        return digest.hexdigest()
+
+    def path(self, key):
+        return os.path.join(self.directory, key[:2], F'{key}.json')
+
+    def get(self, key):
+        path = self.path(key)
+
+        try:
+            with open(path, encoding='utf-8') as f:
+                data = json.load(f)
+            os.utime(path)
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return data
+
+    def put(self, key, data):
+        path = self.path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        temp = F'{path}.{os.getpid()}.tmp'
+        with open(temp, 'w', encoding='utf-8') as f:
+            json.dump(data, f, separators=(',', ':'))
+
+        self.size += os.path.getsize(temp)
+        os.replace(temp, path)
+        self.stores += 1
+
+        if self.size > self.max_bytes:
+            self.evict()
+
+    def entries(self):
+        for root, _, names in os.walk(self.directory):
+            for name in names:
+                if not name.endswith('.json'):
+                    continue
+
+                path = os.path.join(root, name)
+                try:
+                    status = os.stat(path)
+                except OSError:
+                    continue
+
+                yield path, status.st_size, status.st_mtime
+
+    def evict(self, target=None):
+        target = self.max_bytes * 9 // 10 if target is None else target
+        entries = sorted(self.entries(), key=lambda entry: entry[2])
+        self.size = sum(size for _, size, _ in entries)
+
+        for path, size, _ in entries:
+            if self.size <= target:
+                break
+
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+
+            self.size -= size
+            self.evictions += 1
+
+    def compile(self, source, tokens=False, symbol_table=False, max_errors=None, peephole=PATTERNS):
+        key = self.key(source, max_errors, peephole)
+        data = self.get(key)
+
+        if data is None:
+            result = compile_source(source, tokens=True, symbol_table=True, max_errors=max_errors, peephole=peephole)
+            data = result.as_dict()
+            data['ops'], data['operands'] = list(result.program_block.ops), result.program_block.pairs()
+            self.put(key, data)
+        else:
+            result = CompileResult.from_dict(data)
+
+        result.tokens = result.tokens if tokens else None
+        result.symbol_table = result.symbol_table if symbol_table else None
+        return result
+
+    def stats(self):
+        lookups = self.hits + self.misses
+
+        return {
+            'hits': self.hits, 'misses': self.misses, 'stores': self.stores, 'evictions': self.evictions,
+            'hit_rate': self.hits / lookups if lookups else 0.0, 'bytes': self.size,
+        }
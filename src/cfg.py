@@ -0,0 +1,225 @@
+from array import array
+from collections import deque
+
+from deadcode import destination
+from ir import Operand, PLACEHOLDER, DIRECT, INDIRECT, CODE, LABEL, direct
+from ir import ASSIGN, JP, JPF
+
+
+class Block:
+    __slots__ = ('index', 'start', 'end', 'successors', 'predecessors')
+
+    def __init__(self, index, start, end):
+        self.index, self.start, self.end = index, start, end
+        self.successors, self.predecessors = [], []
+
+    def __len__(self):
+        return self.end - self.start
+
+    def __repr__(self):
+        return F'Block({self.index}: {self.start}..{self.end})'
+
+
+class Graph:
+
+    def __init__(self, program):
+        ops, operands = program.ops, program.operands
+        if PLACEHOLDER in ops:
+            raise ValueError('cannot build a graph over unresolved placeholders')
+
+        targets = {
+            operand for operand in set(operands) if operand.__class__ is Operand and operand.mode in (CODE, LABEL)
+        }
+        leaders = {operand.value for operand in targets if operand.value < len(ops)}
+        leaders.update(line + 1 for line, op in enumerate(ops) if (op == JP or op == JPF) and line + 1 < len(ops))
+        leaders = sorted(leaders | {0}) if ops else []
+
+        self.program, self.labels = program, sorted({operand.value for operand in targets if operand.mode == LABEL})
+        self.blocks = [
+            Block(index, start, end) for index, (start, end) in enumerate(zip(leaders, leaders[1:] + [len(ops)]))
+        ]
+        self.block = array('i', bytes(4 * len(ops)))
+        for block in self.blocks:
+            self.block[block.start:block.end] = array('i', (block.index,)) * len(block)
+
+        self.calls, self.returns, self.resolved = {}, [], set()
+        self.link()
+        self.resolve()
+
+    def __len__(self):
+        return len(self.blocks)
+
+    def __iter__(self):
+        return iter(self.blocks)
+
+    def edge(self, block, line):
+        if line < len(self.block):
+            target = self.blocks[self.block[line]]
+            block.successors.append(target)
+            target.predecessors.append(block)
+
+    def link(self):
+        ops, operands = self.program.ops, self.program.operands
+
+        for block in self.blocks:
+            line = block.end - 1
+            op = ops[line]
+
+            if op == JP:
+                target = operands[3 * line]
+                if target.mode != CODE:
+                    self.returns.append(block)
+                    continue
+
+                self.edge(block, target.value)
+                returning = [
+                    operand.value for operand in operands[3 * block.start:3 * block.end]
+                    if operand.__class__ is Operand and operand.mode == LABEL
+                ]
+                if returning:
+                    self.calls[block] = (target.value, returning)
+                continue
+
+            if op == JPF:
+                self.edge(block, operands[3 * line + 1].value)
+
+            self.edge(block, block.end)
+
+    def resolve(self):
+        exits = {}
+        for entry, returning in self.calls.values():
+            exits.setdefault(entry, []).extend(returning)
+
+        for entry, returning in exits.items():
+            if entry >= len(self.block):
+                continue
+
+            seen, stack = set(), [self.blocks[self.block[entry]]]
+            while stack:
+                block = stack.pop()
+                if block in seen:
+                    continue
+                seen.add(block)
+
+                if block in self.calls:
+                    lines = self.calls[block][1]
+                    stack.extend(self.blocks[self.block[line]] for line in lines if line < len(self.block))
+                else:
+                    stack.extend(block.successors)
+
+            for block in self.returns:
+                if block in seen:
+                    self.resolved.add(block)
+                    for line in sorted(set(returning)):
+                        self.edge(block, line)
+
+        for block in self.returns:
+            if block not in self.resolved:
+                for line in self.labels:
+                    self.edge(block, line)
+
+    def check(self):
+        ops, operands = self.program.ops, self.program.operands
+
+        for block, (entry, returning) in self.calls.items():
+            if returning != [block.end]:
+                yield F'call at {block.end - 1} returns to {returning}, expected {block.end}'
+            elif block.end < len(self.block) and \
+                    not any(source in self.returns for source in self.blocks[self.block[block.end]].predecessors):
+                yield F'call at {block.end - 1} into {entry} has no return edge back to {block.end}'
+
+        for block in self.returns:
+            line, target = block.end - 1, operands[3 * block.end - 3]
+            loaded = line > block.start and ops[line - 1] == ASSIGN and operands[3 * line - 2] is direct[target.value]
+            if not loaded:
+                yield F'indirect jump at {line} does not follow a load of its return address'
+            elif block not in self.resolved:
+                yield F'indirect jump at {line} is not reached from any call'
+
+    def order(self):
+        visited, order = bytearray(len(self.blocks)), []
+
+        for root in self.blocks:
+            if visited[root.index]:
+                continue
+
+            visited[root.index], stack = 1, [(root, iter(root.successors))]
+            while stack:
+                block, successors = stack[-1]
+                for successor in successors:
+                    if not visited[successor.index]:
+                        visited[successor.index] = 1
+                        stack.append((successor, iter(successor.successors)))
+                        break
+                else:
+                    order.append(block.index)
+                    stack.pop()
+
+        order.reverse()
+        return order
+
+
+def solve(graph, gen, kill, forward=True, universe=None):
+    blocks, order = graph.blocks, graph.order()
+    if not forward:
+        order.reverse()
+
+    initial = 0 if universe is None else universe
+    inputs, outputs = [initial] * len(blocks), [initial] * len(blocks)
+    before, after = (inputs, outputs) if forward else (outputs, inputs)
+
+    pending, work = bytearray(b'\1') * len(blocks), deque(order)
+    while work:
+        index = work.popleft()
+        pending[index] = 0
+        block = blocks[index]
+        sources = block.predecessors if forward else block.successors
+
+        if not sources:
+            value = 0
+        elif universe is None:
+            value = 0
+            for source in sources:
+                value |= after[source.index]
+        else:
+            value = universe
+            for source in sources:
+                value &= after[source.index]
+
+        before[index] = value
+        value = gen[index] | value & ~kill[index]
+        if value != after[index]:
+            after[index] = value
+            for target in block.successors if forward else block.predecessors:
+                if not pending[target.index]:
+                    pending[target.index] = 1
+                    work.append(target.index)
+
+    return inputs, outputs
+
+
+def transfer(graph, temporaries):
+    ops, operands, block = graph.program.ops, graph.program.operands, graph.block
+    candidates = {
+        operand for operand in set(operands)
+        if operand.__class__ is Operand and operand.mode in (DIRECT, INDIRECT) and operand.value in temporaries
+    }
+
+    bits, gen, kill = {}, [0] * len(graph.blocks), [0] * len(graph.blocks)
+    for index, operand in enumerate(operands):
+        if operand not in candidates:
+            continue
+
+        line = index // 3
+        bit, owner = bits.setdefault(operand.value, 1 << len(bits)), block[line]
+        if operand.mode == DIRECT and index % 3 == destination(ops[line]):
+            kill[owner] |= bit
+        elif not kill[owner] & bit:
+            gen[owner] |= bit
+
+    return bits, gen, kill
+
+
+def liveness(graph, temporaries):
+    bits, gen, kill = transfer(graph, temporaries)
+    return (bits,) + solve(graph, gen, kill, forward=False)
@@ -1,4 +1,229 @@
+import os
+import sys
+import time
+import argparse
+
+from concurrent.futures import ProcessPoolExecutor
+
 from lexeme import Scanner
 from parser import Parser
+from toMC import CodeGen
+from ir import Program
+from peephole import PATTERNS
+
+
+class CompileResult:
+
+    def __init__(self, finished, program_block, lexical_errors, syntax_errors, semantic_errors,
+                 tokens=None, symbol_table=None, tree=None, statistics=None):
+        self.finished = finished
+        self.program_block = program_block
+        self.lexical_errors = lexical_errors
+        self.syntax_errors = syntax_errors
+        self.semantic_errors = semantic_errors
+        self.tokens, self.symbol_table, self.tree = tokens, symbol_table, tree
+        self.statistics = statistics or {}
+
+    @classmethod
+    def from_parser(cls, parser, tokens=False, symbol_table=False):
+        scanner, cg = parser.scanner, parser.cg
+
+        return cls(
+            cg.finished, cg.program_block, scanner.lexical_errors, parser.errors, cg.semantic_errors,
+            list(scanner.tokens) if tokens else None,
+            list(scanner.symbol_table) if symbol_table else None,
+            parser.tree if parser.tree is not None and parser.tree.root != -1 else None,
+            dict(cg.statistics)
+        )
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(
+            data['finished'],
+            Program.restore(data['ops'], data['operands']) if 'ops' in data else Program.parse(data['program_block']),
+            [getattr(Scanner.Error, error['kind'])(error['object'], error['lineno'], error['offset'])
+             for error in data['lexical_errors']],
+            data['syntax_errors'], data['semantic_errors'],
+            None if data['tokens'] is None else [Scanner.Token(*token) for token in data['tokens']],
+            data['symbol_table'], statistics=data.get('statistics')
+        )
+
+    @property
+    def ok(self):
+        return self.finished and not (self.lexical_errors or self.syntax_errors or self.semantic_errors)
+
+    @property
+    def output(self):
+        return CodeGen.format_output(self.program_block, self.semantic_errors) if self.finished else None
+
+    def as_dict(self):
+        return {
+            'ok': self.ok,
+            'finished': self.finished,
+            'output': self.output,
+            'program_block': self.program_block.lines(),
+            'lexical_errors': [
+                {'kind': type(error).__name__, 'object': error.object, 'lineno': error.lineno,
+                 'offset': error.offset, 'message': str(error)} for error in self.lexical_errors
+            ],
+            'syntax_errors': self.syntax_errors,
+            'semantic_errors': self.semantic_errors,
+            'tokens': None if self.tokens is None else [
+                [token.lexeme, token.token, token.lineno] for token in self.tokens
+            ],
+            'symbol_table': self.symbol_table,
+            'statistics': self.statistics,
+        }
+
+    def write_binary(self, directory='.'):
+        if self.finished and not self.semantic_errors:
+            import binary
+            binary.dump(self.program_block, os.path.join(directory, 'output.bin'))
+
+    def write(self, directory='.'):
+        if not self.finished:
+            return
+
+        with open(os.path.join(directory, 'output.txt'), 'w') as f:
+            f.write(self.output)
+
+        with open(os.path.join(directory, 'semantic_errors.txt'), 'w') as f:
+            f.write(CodeGen.format_semantic_errors(self.semantic_errors))
+
+
+def compile_source(source, tokens=False, symbol_table=False, build_tree=False, max_errors=None, peephole=PATTERNS):
+    scanner = Scanner(source=source, keep_tokens=tokens)
+    parser = Parser(scanner, build_tree=build_tree, max_errors=max_errors, directory=None, peephole=peephole)
+    parser.proc()
+    return CompileResult.from_parser(parser, tokens, symbol_table)
+
+
+def collect(paths, suffix='.txt'):
+    files = []
+
+    for path in paths:
+        if not os.path.isdir(path):
+            files.append((path, os.path.splitext(os.path.basename(path))[0]))
+            continue
+
+        for root, directories, names in os.walk(path):
+            directories.sort()
+            for name in sorted(names):
+                if name.endswith(suffix):
+                    full = os.path.join(root, name)
+                    files.append((full, os.path.splitext(os.path.relpath(full, path))[0]))
+
+    return files
+
+
+def compile_file(path, directory='.', cache=None, binary=False, peephole=PATTERNS):
+    os.makedirs(directory, exist_ok=True)
+    start, hit, counts = time.perf_counter(), False, None
+
+    try:
+        if cache is None:
+            parser = Parser(Scanner(path, keep_tokens=False), directory=directory, peephole=peephole)
+            parser.proc()
+            result = CompileResult.from_parser(parser)
+        else:
+            from cache import Cache
+            cache = Cache.shared(cache)
+
+            hits = cache.hits
+            with open(path, 'rb') as f:
+                result = cache.compile(f.read(), peephole=peephole)
+            result.write(directory)
+            hit = cache.hits > hits
+
+        if binary:
+            result.write_binary(directory)
+
+        if result.finished and not result.semantic_errors:
+            counts = len(result.program_block), result.statistics
+
+        failure = None
+    except Exception as error:
+        failure = F'{type(error).__name__}: {error}'
+
+    return path, time.perf_counter() - start, os.path.getsize(path), failure, hit, counts
+
+
+def batch(paths, output='out', jobs=None, cache=None, binary=False, peephole=PATTERNS):
+    files = collect(paths)
+    jobs = jobs or os.cpu_count() or 1
+    targets = [os.path.join(output, name) for _, name in files]
+    sources = [path for path, _ in files]
+    caches, binaries, peepholes = [cache] * len(files), [binary] * len(files), [peephole] * len(files)
+
+    if jobs == 1 or len(files) < 2:
+        return list(map(compile_file, sources, targets, caches, binaries, peepholes))
+
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        chunksize = max(1, len(files) // (jobs * 4))
+        return list(pool.map(compile_file, sources, targets, caches, binaries, peepholes, chunksize=chunksize))
+
+
+def describe(instructions, statistics):
+    parts = [F'{instructions} instructions']
+
+    for name, value in statistics.items():
+        if name == 'timings':
+            parts.extend(F'{kind} {seconds * 1000:.1f} ms' for kind, seconds in value.items())
+        elif isinstance(value, dict):
+            parts.extend(F'{count} {kind}' for kind, count in value.items() if count)
+        elif isinstance(value, list):
+            parts.append(F'{len(value)} {name}')
+        elif value:
+            parts.append(F'{value} {name}')
+
+    return ', '.join(parts)
+
+
+def main(argv=None):
+    arguments = argparse.ArgumentParser(description='Compile source files into three address code.')
+    arguments.add_argument('inputs', nargs='*', help='source files or directories of .txt sources')
+    arguments.add_argument('-o', '--output', default='out', help='directory for per-input outputs')
+    arguments.add_argument('-j', '--jobs', type=int, default=None, help='worker processes (default: all cores)')
+    arguments.add_argument('-q', '--quiet', action='store_true', help='only print the summary')
+    arguments.add_argument('--cache', help='directory of the compilation cache')
+    arguments.add_argument('--binary', action='store_true', help='also write output.bin, a packed object file')
+    arguments.add_argument(
+        '--peephole', type=lambda text: tuple(filter(None, text.split(','))), default=PATTERNS,
+        help=F'comma separated peephole patterns, empty to disable (default: {",".join(PATTERNS)})')
+    options = arguments.parse_args(argv)
+
+    unknown = set(options.peephole) - set(PATTERNS)
+    if unknown:
+        arguments.error(F'unknown peephole patterns: {", ".join(sorted(unknown))}')
+
+    if not options.inputs:
+        parser = Parser(Scanner('input.txt', keep_tokens=False), peephole=options.peephole)
+        parser.proc()
+        if options.binary:
+            CompileResult.from_parser(parser).write_binary()
+        return 0
+
+    start = time.perf_counter()
+    results = batch(options.inputs, options.output, options.jobs, options.cache, options.binary, options.peephole)
+    elapsed = time.perf_counter() - start
+
+    for path, seconds, size, failure, hit, counts in results:
+        if not options.quiet or failure:
+            print(F'{path}\t{seconds * 1000:.1f} ms\t{size} B' + ('\tcached' if hit else '') +
+                  (F'\t{describe(*counts)}' if counts else '') +
+                  (F'\tfailed: {failure}' if failure else ''))
+
+    total = sum(result[2] for result in results)
+    failed = sum(1 for result in results if result[3])
+    hits = F', {sum(result[4] for result in results)} cached' if options.cache else ''
+    print(
+        F'{len(results)} files, {failed} failed{hits}, {total / 1024:.1f} KiB in {elapsed:.2f}s '
+        F'({len(results) / elapsed:.1f} files/s, {total / 1024 / elapsed:.1f} KiB/s)',
+        file=sys.stderr
+    )
+
+    return 1 if failed else 0
+
 
-if __name__ == '__main__': Parser(Scanner('input.txt')).proc()
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,140 @@
+from ir import Operand, PLACEHOLDER, ARITY, DIRECT, INDIRECT, CODE, LABEL, direct
+from ir import ASSIGN, JP, JPF
+
+
+def destination(op):
+    return 1 if op == ASSIGN else 2 if op < ASSIGN else None
+
+
+class DeadCode:
+
+    def __init__(self):
+        self.statistics = dict.fromkeys(('functions', 'unreachable', 'stores', 'temporaries', 'slots'), 0)
+
+    def run(self, program, entries=(), slots=range(0), variables=None, temporaries=()):
+        if PLACEHOLDER in program.ops:
+            return program
+
+        keep = self.reachable(program)
+        self.statistics['functions'] += sum(1 for entry in entries if entry < len(keep) and not keep[entry])
+        self.statistics['unreachable'] += keep.count(0)
+
+        if variables:
+            self.stores(program, keep, variables)
+
+        self.temporaries(program, keep, temporaries)
+        self.slots(program, keep, slots)
+        return program.compact(keep)
+
+    @staticmethod
+    def reachable(program):
+        ops, operands = program.ops, program.operands
+        keep, stack = bytearray(len(ops)), [0]
+
+        while stack:
+            line = stack.pop()
+
+            while line < len(ops) and not keep[line]:
+                keep[line], op = 1, ops[line]
+
+                if op == JP:
+                    target = operands[3 * line]
+                    if target.mode != CODE:
+                        break
+                    line = target.value
+                    continue
+
+                if op == JPF:
+                    stack.append(operands[3 * line + 1].value)
+                else:
+                    stack.extend(
+                        operand.value for operand in operands[3 * line:3 * line + ARITY[op]]
+                        if operand.__class__ is Operand and operand.mode == LABEL
+                    )
+
+                line += 1
+
+        return keep
+
+    def stores(self, program, keep, variables):
+        ops, operands = program.ops, program.operands
+        reads, stores = set(), {}
+
+        for line, op in enumerate(ops):
+            if not keep[line]:
+                continue
+
+            for slot, operand in enumerate(operands[3 * line:3 * line + ARITY[op]]):
+                if operand in variables:
+                    if slot == destination(op):
+                        stores.setdefault(variables[operand], []).append(line)
+                    else:
+                        reads.add(variables[operand])
+
+        for variable, lines in stores.items():
+            if variable not in reads:
+                for line in lines:
+                    keep[line] = 0
+                self.statistics['stores'] += len(lines)
+
+    def temporaries(self, program, keep, temporaries):
+        ops, operands = program.ops, program.operands
+        reads, definitions = {}, {}
+
+        def uses(line):
+            target = destination(ops[line])
+            for slot, operand in enumerate(operands[3 * line:3 * line + ARITY[ops[line]]]):
+                if operand.__class__ is not Operand or operand.mode not in (DIRECT, INDIRECT) \
+                        or operand.value not in temporaries:
+                    continue
+
+                yield operand.value, slot == target and operand.mode == DIRECT
+
+        candidates = {
+            operand for operand in set(operands)
+            if operand.__class__ is Operand and operand.mode in (DIRECT, INDIRECT) and operand.value in temporaries
+        }
+
+        for index, operand in enumerate(operands):
+            if operand in candidates and keep[index // 3]:
+                if operand.mode == DIRECT and index % 3 == destination(ops[index // 3]):
+                    definitions.setdefault(operand.value, []).append(index // 3)
+                else:
+                    reads[operand.value] = reads.get(operand.value, 0) + 1
+
+        dead = [temp for temp in definitions if not reads.get(temp)]
+        while dead:
+            for line in definitions.pop(dead.pop(), ()):
+                keep[line] = 0
+                self.statistics['temporaries'] += 1
+
+                for temp, written in uses(line):
+                    if not written:
+                        reads[temp] -= 1
+                        if not reads[temp] and temp in definitions:
+                            dead.append(temp)
+
+    def slots(self, program, keep, slots):
+        ops, operands = program.ops, program.operands
+        read, stores = set(), []
+        candidates = {
+            operand for operand in set(operands)
+            if operand.__class__ is Operand and operand.mode == DIRECT and operand.value in slots
+        }
+
+        for index, operand in enumerate(operands):
+            if operand in candidates and keep[index // 3]:
+                if index % 3 == destination(ops[index // 3]):
+                    stores.append(index // 3)
+                else:
+                    read.add(operand.value)
+
+        for line in stores:
+            if operands[3 * line + destination(ops[line])].value not in read:
+                keep[line] = 0
+                self.statistics['slots'] += 1
+
+        moved = {direct[value]: direct[slots.start + slots.step * index] for index, value in enumerate(sorted(read))}
+        for index, operand in enumerate(operands):
+            if operand in moved:
+                operands[index] = moved[operand]
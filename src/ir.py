@@ -0,0 +1,266 @@
+import re
+
+from enum import IntEnum
+from array import array
+from bisect import bisect_left
+from itertools import compress
+
+
+class Op(IntEnum):
+    ADD = 0
+    SUB = 1
+    MULT = 2
+    EQ = 3
+    LT = 4
+    ASSIGN = 5
+    JP = 6
+    JPF = 7
+    PRINT = 8
+
+
+ADD, SUB, MULT, EQ, LT, ASSIGN, JP, JPF, PRINT = Op
+NAMES = tuple(op.name for op in Op)
+ARITY = (3, 3, 3, 3, 3, 2, 1, 2, 1)
+PLACEHOLDER = 255
+
+DIRECT, IMMEDIATE, INDIRECT, CODE, LABEL = range(5)
+PREFIX = ('', '#', '@', '', '#')
+
+INSTRUCTION = re.compile(r'\((\w+),\s*(.*)\)$')
+
+
+class Operand:
+    __slots__ = ('mode', 'value', 'text')
+
+    def __init__(self, value, mode=DIRECT):
+        self.mode, self.value, self.text = mode, value, F'{PREFIX[mode]}{value}'
+
+    @classmethod
+    def parse(cls, text, target=False):
+        text = text.strip()
+
+        if text[:1] == '#':
+            return immediate[int(text[1:])]
+
+        if text[:1] == '@':
+            return indirect[int(text[1:])]
+
+        return (code if target else direct)[int(text)]
+
+    def __str__(self):
+        return self.text
+
+    def __repr__(self):
+        return F'Operand({self.text})'
+
+
+class Operands(dict):
+    __slots__ = ('mode',)
+
+    def __init__(self, mode):
+        super().__init__()
+        self.mode = mode
+
+    def __missing__(self, value):
+        operand = self[value] = Operand(value, self.mode)
+        return operand
+
+
+direct, immediate, indirect, code, label = map(Operands, (DIRECT, IMMEDIATE, INDIRECT, CODE, LABEL))
+
+
+class Placeholder:
+    __slots__ = ('kind',)
+
+    SAVED, BREAK, RETURN = 'saved!', 'break', 'return'
+
+    def __init__(self, kind):
+        self.kind = kind
+
+    def __str__(self):
+        return self.kind
+
+    def __repr__(self):
+        return F'Placeholder({self.kind!r})'
+
+
+class Instruction:
+    __slots__ = ('op', 'a', 'b', 'c')
+
+    def __init__(self, op, a=None, b=None, c=None):
+        self.op, self.a, self.b, self.c = op, a, b, c
+
+    @classmethod
+    def parse(cls, text):
+        text = text.strip()
+        if text in (Placeholder.SAVED, Placeholder.BREAK, Placeholder.RETURN):
+            return Placeholder(text)
+
+        match = INSTRUCTION.match(text)
+        if match is None or match.group(1) not in Op.__members__:
+            raise ValueError(F'cannot parse instruction {text!r}')
+
+        op = Op[match.group(1)]
+        fields = match.group(2).split(',')
+        if len(fields) != ARITY[op]:
+            raise ValueError(F'{op.name} takes {ARITY[op]} operands, got {text!r}')
+
+        jumps = op == JP or op == JPF
+        return cls(op, *(
+            None if field.strip() == 'None' else Operand.parse(field, jumps and index == len(fields) - 1)
+            for index, field in enumerate(fields)
+        ))
+
+    @property
+    def operands(self):
+        return (self.a, self.b, self.c)[:ARITY[self.op]]
+
+    def __str__(self):
+        return render(self.op, self.a, self.b, self.c)
+
+    def __repr__(self):
+        return F'Instruction{self}'
+
+
+def render(op, a, b, c):
+    try:
+        if op < ASSIGN:
+            return F'({NAMES[op]}, {a.text}, {b.text}, {c.text})'
+        if op == ASSIGN or op == JPF:
+            return F'({NAMES[op]}, {a.text}, {b.text})'
+        if op == PLACEHOLDER:
+            return a.kind
+        return F'({NAMES[op]}, {a.text})'
+    except AttributeError:
+        return F'({NAMES[op]}, {", ".join(map(str, (a, b, c)[:ARITY[op]]))})'
+
+
+class Program:
+    __slots__ = ('ops', 'operands')
+
+    def __init__(self, instructions=()):
+        self.ops, self.operands = array('B'), []
+
+        for instruction in instructions:
+            self.add(instruction)
+
+    @classmethod
+    def parse(cls, lines):
+        return cls(Instruction.parse(line) for line in lines)
+
+    def append(self, op, a=None, b=None, c=None):
+        self.ops.append(op)
+        self.operands += (a, b, c)
+
+    def add(self, instruction):
+        if isinstance(instruction, Placeholder):
+            self.append(PLACEHOLDER, instruction)
+        else:
+            self.append(instruction.op, instruction.a, instruction.b, instruction.c)
+
+    def __len__(self):
+        return len(self.ops)
+
+    def __getitem__(self, index):
+        op = self.ops[index]
+        a, b, c = self.operands[3 * index:3 * index + 3]
+        return a if op == PLACEHOLDER else Instruction(Op(op), a, b, c)
+
+    def __setitem__(self, index, instruction):
+        if isinstance(instruction, Placeholder):
+            self.ops[index], self.operands[3 * index:3 * index + 3] = PLACEHOLDER, (instruction, None, None)
+        else:
+            self.ops[index] = instruction.op
+            self.operands[3 * index:3 * index + 3] = instruction.a, instruction.b, instruction.c
+
+    def __iter__(self):
+        return map(self.__getitem__, range(len(self.ops)))
+
+    def intervals(self, temporaries):
+        ops, operands = self.ops, self.operands
+        candidates = {
+            operand for operand in set(operands)
+            if operand.__class__ is Operand and operand.mode in (DIRECT, INDIRECT) and operand.value in temporaries
+        }
+
+        first, last, pinned, barriers = {}, {}, set(), set()
+        for index, operand in enumerate(operands):
+            if operand not in candidates:
+                continue
+
+            line, slot, temp = index // 3, index % 3, operand.value
+            if temp not in first:
+                first[temp] = line
+                if operand.mode != DIRECT or slot != (1 if ops[line] == ASSIGN else 2):
+                    pinned.add(temp)
+            last[temp] = line
+
+        for line, op in enumerate(ops):
+            if op == JP or op == JPF:
+                barriers.add(line)
+                target = operands[3 * line + (0 if op == JP else 1)]
+                if target.mode == CODE:
+                    barriers.add(target.value - 1)
+
+        barriers = sorted(barriers)
+        for temp, line in first.items():
+            index = bisect_left(barriers, line)
+            if index < len(barriers) and barriers[index] < last[temp]:
+                pinned.add(temp)
+
+        return first, last, pinned
+
+    def compact(self, keep):
+        if all(keep):
+            return self
+
+        position = array('i', bytes(4 * (len(keep) + 1)))
+        for line, kept in enumerate(keep):
+            position[line + 1] = position[line] + kept
+
+        moved = {
+            operand: (code if operand.mode == CODE else label)[position[operand.value]]
+            for operand in set(self.operands) if operand.__class__ is Operand and operand.mode in (CODE, LABEL)
+        }
+
+        slots = bytes(kept for kept in keep for _ in range(3))
+        self.ops = array('B', compress(self.ops, keep))
+        self.operands = [moved.get(operand, operand) for operand in compress(self.operands, slots)]
+        return self
+
+    def pairs(self):
+        return [
+            operand if operand is None else
+            [operand.mode, operand.value] if operand.__class__ is Operand else str(operand)
+            for operand in self.operands
+        ]
+
+    @classmethod
+    def restore(cls, ops, pairs):
+        program, tables = cls(), (direct, immediate, indirect, code, label)
+        program.ops = array('B', ops)
+        program.operands = operands = [
+            tables[pair[0]][pair[1]] if pair.__class__ is list else pair for pair in pairs
+        ]
+
+        for line, op in enumerate(program.ops):
+            if op == PLACEHOLDER:
+                operands[3 * line] = Placeholder(operands[3 * line])
+
+        return program
+
+    def lines(self):
+        operands, lines = self.operands, []
+
+        for op, a, b, c in zip(self.ops, operands[0::3], operands[1::3], operands[2::3]):
+            try:
+                if op < ASSIGN:
+                    lines.append(F'({NAMES[op]}, {a.text}, {b.text}, {c.text})')
+                elif op == ASSIGN:
+                    lines.append(F'(ASSIGN, {a.text}, {b.text})')
+                else:
+                    lines.append(render(op, a, b, c))
+            except AttributeError:
+                lines.append(render(op, a, b, c))
+
+        return lines
@@ -1,18 +1,106 @@
+import io
 import re
 import os
+import sys
 
+from array import array
+from bisect import bisect_left
 from itertools import groupby
 
 
 class Scanner:
+    BLOCK_SIZE = 1 << 16
+
     class Token:
+        __slots__ = ('lexeme', 'token', 'lineno', 'symbol')
 
-        def __init__(self, lexeme, token, lineno):
+        def __init__(self, lexeme, token, lineno, symbol=None):
             self.lexeme, self.token, self.lineno = lexeme, token, lineno
+            self.symbol = symbol
 
         def __str__(self):
             return '(%s, %s)' % (self.token, self.lexeme)
 
+    class SymbolTable:
+
+        def __init__(self, lexemes=()):
+            self.ids, self.lexemes = {}, []
+            for lexeme in lexemes:
+                self.add(lexeme)
+
+        def add(self, lexeme):
+            symbol = self.ids.get(lexeme)
+            if symbol is None:
+                lexeme = sys.intern(lexeme)
+                symbol = self.ids[lexeme] = len(self.lexemes)
+                self.lexemes.append(lexeme)
+
+            return symbol
+
+        def index(self, lexeme):
+            return self.ids[lexeme]
+
+        def __getitem__(self, symbol):
+            return self.lexemes[symbol]
+
+        def __contains__(self, lexeme):
+            return lexeme in self.ids
+
+        def __iter__(self):
+            return iter(self.lexemes)
+
+        def __len__(self):
+            return len(self.lexemes)
+
+    class TokenBuffer:
+        KEYWORD, ID, NUM, SYMBOL = range(4)
+        KINDS = ('KEYWORD', 'ID', 'NUM', 'SYMBOL')
+
+        def __init__(self, symbol_table, literals):
+            self.tables = (symbol_table, symbol_table, literals, literals)
+            self.kinds, self.symbols, self.linenos = array('B'), array('i'), array('i')
+            self.offsets = array('i')
+
+        def append(self, kind, symbol, lineno, offset):
+            self.kinds.append(kind)
+            self.symbols.append(symbol)
+            self.linenos.append(lineno)
+            self.offsets.append(offset)
+
+        def lexeme(self, index):
+            return self.tables[self.kinds[index]][self.symbols[index]]
+
+        def terminal(self, index):
+            kind = self.kinds[index]
+            return self.KINDS[kind] if kind in (self.ID, self.NUM) else self.tables[kind][self.symbols[index]]
+
+        def clear(self):
+            self.truncate(0)
+
+        def truncate(self, index):
+            del self.kinds[index:], self.symbols[index:], self.linenos[index:], self.offsets[index:]
+
+        def tail(self, index):
+            return self.kinds[index:], self.symbols[index:], self.linenos[index:], self.offsets[index:]
+
+        def splice(self, tail, lines, shift):
+            kinds, symbols, linenos, offsets = tail
+            self.kinds.extend(kinds)
+            self.symbols.extend(symbols)
+            self.linenos.extend(array('i', map(lines.__add__, linenos)) if lines else linenos)
+            self.offsets.extend(array('i', map(shift.__add__, offsets)) if shift else offsets)
+
+        def __getitem__(self, index):
+            kind, symbol = self.kinds[index], self.symbols[index]
+            return Scanner.Token(
+                self.tables[kind][symbol], self.KINDS[kind], self.linenos[index], symbol if kind <= self.ID else None)
+
+        def __iter__(self):
+            return map(self.__getitem__, range(len(self)))
+
+        def __len__(self):
+            return len(self.kinds)
+
     class Error:
 
         class Base(Exception):
@@ -22,8 +110,9 @@ class Scanner:
 
             message = 'Default error'
 
-            def __init__(self, whatis, lineno):
+            def __init__(self, whatis, lineno, offset=None):
                 self.object, self.lineno = whatis, lineno
+                self.offset = offset
 
         class InvalidNumber(Base):
             message = 'Invalid number'
@@ -157,20 +246,72 @@ class Scanner:
                 {'re': re.compile(r'F2'), 'ne': 'panic_mode', 'refresh': True},
             ]}
 
-    def __init__(self, address):
-        self.lexical_errors, self.tokens, self.symbol_table = [], [], []
+            cls.table = {state: {} for state in cls.states}
+            for state in cls.states:
+                for code in range(128):
+                    cls.resolve(state, chr(code))
+
+            cls.restarts = {state: {
+                ch for ch, move in cls.table[state].items()
+                if move and move[1] and cls.table['start'][ch] and move[0] == cls.table['start'][ch][0]
+            } for state in cls.states}
+
+            cls.pattern = re.compile(r'[\s|]*(?:%s)|(?P<whitespace>[\s|]+)' % '|'.join([
+                r'(?P<comment_line>//[^\n]*)',
+                r'(?P<start>/\*(?:[^*]|\*[^/])*\*/)',
+                r'(?P<identifier>[a-zA-Z][a-zA-Z0-9]*)',
+                r'(?P<number>[0-9]+)',
+                r'(?P<double_equal>==)',
+                r'(?P<symbol_equal>=)',
+                r'(?P<symbol_star>[*])',
+                r'(?P<symbol>[\;\:\,\[\]()\{\}\+\-<])',
+            ]))
+            cls.silent = {'start', 'whitespace', 'comment_line'}
+
+            cls.kinds = {
+                'number': Scanner.TokenBuffer.NUM,
+                'symbol': Scanner.TokenBuffer.SYMBOL,
+                'symbol_equal': Scanner.TokenBuffer.SYMBOL,
+                'double_equal': Scanner.TokenBuffer.SYMBOL,
+                'symbol_star': Scanner.TokenBuffer.SYMBOL,
+            }
+
+        @classmethod
+        def match(cls, state, ch):
+            for checker in cls.states[state]:
+                if checker['re'].fullmatch(ch):
+                    return checker['ne'], 'refresh' in checker
+
+        @classmethod
+        def resolve(cls, state, ch):
+            cls.table[state][ch] = move = cls.match(state, ch)
+            return move
+
+    def __init__(self, address=None, table_driven=True, keep_tokens=True, fast_path=True, source=None):
+        self.lexical_errors = []
+        self.source = source.decode('utf-8') if isinstance(source, bytes) else source
+
+        if not hasattr(self.State, 'table'):
+            self.State.initialize()
 
-        self.State.initialize()
         self.current_state = 'start'
         self.address = address
+        self.table_driven = table_driven
+        self.keep_tokens = keep_tokens
+        self.fast_path = fast_path
         self.scanning = False
-        self.lineno, self.buffer = 1, ''
+        self.lineno, self.buffer, self.blank = 1, '', 0
+        self.text, self.start = '', 0
+        self.offset, self.mark = 0, 0
+        self.edited = False
 
         self.keywords = [
             'if', 'else', 'void', 'int', 'repeat', 'break', 'until', 'return', 'endif'
         ]
 
-        self.symbol_table.extend(self.keywords)
+        self.symbol_table = self.SymbolTable(self.keywords)
+        self.literals = self.SymbolTable()
+        self.tokens = self.TokenBuffer(self.symbol_table, self.literals)
         self.keywords = set(self.keywords)
 
     @property
@@ -187,96 +328,215 @@ class Scanner:
 
     @property
     def symbol_table_to_string(self):
+        symbols = self._ordered_symbols() if self.edited else self.symbol_table
         return '\n'.join([
-            F'{lineno}.\t' + symbol for lineno, symbol in enumerate(self.symbol_table, start=1)])
+            F'{lineno}.\t' + symbol for lineno, symbol in enumerate(symbols, start=1)])
 
-    def update(self, character):
+    def update(self, characters):
 
-        if not character:
+        if not characters:
             self._end()
             return
 
-        self._update(character)
-        self.lineno += character == '\n'
+        self.text, self.start = characters, 0
+        if self.fast_path:
+            self._scan(characters)
 
-    def get_next_token(self):
-        with open(self.address, 'r') as f:
+        else:
+            for position, character in enumerate(characters):
+                self._update(character, position)
+                self.lineno += character == '\n'
+
+        self.buffer += characters[self.start:]
+        self.offset += len(characters)
+
+    def scan(self):
+        with open(self.address, 'r') if self.source is None else io.StringIO(self.source) as f:
             self.scanning = True
-            counter = 0
 
             while self.scanning:
-                self.update(f.read(1))
-                if len(self.tokens) > counter:
-                    yield self.tokens[counter]
-                    counter += 1
+                if not self.keep_tokens:
+                    self.tokens.clear()
+
+                start = len(self.tokens)
+                self.update(f.read(self.BLOCK_SIZE))
+                yield start
+
+    def get_next_token(self):
+        for start in self.scan():
+            for index in range(start, len(self.tokens)):
+                yield self.tokens[index]
 
         yield self.Token('$', 'KEYWORD', self.lineno)
 
-    def _save_turn(self, _buffer):
+    def _save_turn(self, lexeme):
 
-        lineno = self.lineno - self.buffer.count('\n')
+        lineno = self.lineno - lexeme.count('\n')
+        _buffer = lexeme.strip()
 
         if not _buffer:
             return
 
         if self.current_state == 'unmatched_comment':
-            self.lexical_errors.append(self.Error.UnmatchedComment(_buffer, lineno))
+            self.lexical_errors.append(self.Error.UnmatchedComment(_buffer, lineno, self.mark))
 
         elif self.current_state == 'invalid_number':
-            self.lexical_errors.append(self.Error.InvalidNumber(_buffer, lineno))
+            self.lexical_errors.append(self.Error.InvalidNumber(_buffer, lineno, self.mark))
 
         elif self.current_state in ('panic_mode', 'starting_comment'):
-            self.lexical_errors.append(self.Error.InvalidInput(_buffer, lineno))
+            self.lexical_errors.append(self.Error.InvalidInput(_buffer, lineno, self.mark))
 
         elif self.current_state == 'identifier':
-            token = self.Token(
-                _buffer, 'KEYWORD' if _buffer in self.keywords else 'ID', lineno)
-            self.tokens.append(token)
-
-            if _buffer not in self.symbol_table:
-                self.symbol_table.append(_buffer)
+            self.tokens.append(
+                self.TokenBuffer.KEYWORD if _buffer in self.keywords else self.TokenBuffer.ID,
+                self.symbol_table.add(_buffer), lineno, self.mark)
         else:
 
-            token = {
-                'number': 'NUM',
-                'symbol': 'SYMBOL',
-                'symbol_equal': 'SYMBOL',
-                'double_equal': 'SYMBOL',
-                'symbol_star': 'SYMBOL',
-            }.get(self.current_state)
+            kind = self.State.kinds.get(self.current_state)
 
-            if token:
-                token = self.Token(_buffer, token, lineno)
-                self.tokens.append(token)
+            if kind is not None:
+                self.tokens.append(kind, self.literals.add(_buffer), lineno, self.mark)
 
-    def _update(self, ch):
+    def _scan(self, characters):
+        restarts, match, silent = self.State.restarts, self.State.pattern.match, self.State.silent
+        position, length = 0, len(characters)
 
-        for checker in self.State.states[self.current_state]:
-            if not checker['re'].fullmatch(ch):
+        while position < length:
+            ch = characters[position]
+
+            found = ch in restarts[self.current_state] and match(characters, position)
+            if not found:
+                self._update(ch, position)
+                self.lineno += ch == '\n'
+                position += 1
                 continue
 
-            if 'refresh' in checker:
-                self._save_turn(self.buffer.strip())
-                self.buffer = ch
-                self.current_state = checker['ne']
+            if self.current_state not in silent:
+                self._save_turn(self.buffer + characters[self.start:position])
 
-            else:
-                self.buffer += ch
-                self.current_state = checker['ne']
+            self.current_state, end = found.lastgroup, found.end()
+            self.buffer, self.blank = '', 0
+            self.start = end - 1 if self.current_state == 'start' else found.start(self.current_state)
+            self.mark = self.offset + self.start
+            self.lineno += characters.count('\n', position, end)
+            position = end
+
+    def _update(self, ch, position):
 
+        if self.table_driven:
+            row = self.State.table[self.current_state]
+            move = row[ch] if ch in row else self.State.resolve(self.current_state, ch)
+        else:
+            move = self.State.match(self.current_state, ch)
+
+        if move:
+            state, refresh = move
+
+            if refresh:
+                self._save_turn(self.buffer + self.text[self.start:position])
+                self.buffer, self.start, self.blank = '', position, 0
+                self.mark = self.offset + position
+
+            self.current_state = state
             return
 
-        lineno = self.lineno - (self.buffer + ch).count('\n')
+        lexeme = self.buffer + self.text[self.start:position]
+        if self.current_state == 'whitespace':
+            rest = lexeme.lstrip()
+            self.blank += lexeme.count('\n', 0, len(lexeme) - len(rest))
+            lexeme = rest
+
+        lexeme += ch
+        lineno = self.lineno - self.blank - lexeme.count('\n')
+        offset = self.offset + position + 1 - len(lexeme.lstrip())
         self.lexical_errors.append(
             self.Error.InvalidInput(
-                (self.buffer + ch).strip(), lineno))
+                lexeme.strip(), lineno, offset))
+
+        self.buffer, self.start = lexeme[:-1], position + 1
 
     def _end(self):
-        self._update('\n')
+        self.text, self.start = '\n', 0
+        self._update('\n', 0)
+        self.buffer += self.text[self.start:]
         self.scanning = False
         if self.current_state not in ('ongoing_comment', 'ending_comment'):
             return
 
         _buffer = self.buffer[:-1][:7] + ('...' if len(self.buffer) > 7 else '')
         _lineno = self.lineno - self.buffer.count('\n') + 1
-        self.lexical_errors.append(self.Error.UnclosedComment(_buffer, _lineno))
\ No newline at end of file
+        self.lexical_errors.append(self.Error.UnclosedComment(_buffer, _lineno, self.mark))
+
+    def relex(self, source, edit):
+        if not self.keep_tokens:
+            raise ValueError('relex needs the previous token stream, scan with keep_tokens=True')
+
+        offset, removed, inserted = edit
+        shift, edited_end = len(inserted) - removed, offset + len(inserted)
+        tokens, offsets = self.tokens, self.tokens.offsets
+
+        index = bisect_left(offsets, offset)
+        while index and not (offsets[index - 1] and self._blank(source[offsets[index - 1] - 1])):
+            index -= 1
+
+        restart = offsets[index - 1] if index else 0
+        index = max(index - 1, 0)
+
+        tail, errors, lineno = tokens.tail(index), self.lexical_errors, self.lineno
+        self.lexical_errors = [error for error in errors if error.offset < restart]
+        errors = [error for error in errors if error.offset >= restart]
+        tokens.truncate(index)
+
+        self.current_state = 'whitespace' if restart else 'start'
+        self.lineno = tail[2][0] if restart else 1
+        self.buffer, self.text, self.start, self.blank = '', '', 0, 0
+        self.offset, self.mark = restart, restart
+        self.edited, self.scanning = True, True
+
+        checked, size = index, 256
+        while self.scanning:
+            self.update(source[self.offset:self.offset + size])
+            size = min(size * 2, self.BLOCK_SIZE)
+
+            for checked in range(checked, len(tokens)):
+                position = offsets[checked]
+                if position <= edited_end or not self._blank(source[position - 1]):
+                    continue
+
+                found = bisect_left(tail[3], position - shift)
+                if found == len(tail[3]) or tail[3][found] != position - shift:
+                    continue
+
+                lines = tokens.linenos[checked] - tail[2][found]
+                tokens.truncate(checked)
+                tokens.splice([column[found:] for column in tail], lines, shift)
+
+                self.lexical_errors = [error for error in self.lexical_errors if error.offset < position]
+                for error in errors:
+                    if error.offset >= position - shift:
+                        error.offset, error.lineno = error.offset + shift, error.lineno + lines
+                        self.lexical_errors.append(error)
+
+                self.lineno, self.scanning = lineno + lines, False
+                break
+            else:
+                checked = len(tokens)
+
+        return self
+
+    def _blank(self, ch):
+        row = self.State.table['start']
+        move = row[ch] if ch in row else self.State.resolve('start', ch)
+        return bool(move) and move[0] == 'whitespace'
+
+    def _ordered_symbols(self):
+        seen = set(self.keywords)
+        symbols = [symbol for symbol in self.symbol_table if symbol in seen]
+
+        for kind, symbol in zip(self.tokens.kinds, self.tokens.symbols):
+            lexeme = self.symbol_table[symbol] if kind == self.TokenBuffer.ID else None
+            if lexeme is not None and lexeme not in seen:
+                seen.add(lexeme)
+                symbols.append(lexeme)
+
+        return symbols
\ No newline at end of file
@@ -0,0 +1,275 @@
+# Generated by tablegen.py from grammar.txt and actions.txt, do not edit.
+VERSION = 1
+DIGEST = '5cb71db8f9bdbedaee97821887e2ed0c15d1b88c'
+STATES = {
+    'program': {
+        'paths': (('#start_program', 'declaration-list', '$', '#end_program'),),
+        'first': (('$', 'int', 'void'),),
+        'follow': (),
+        'dispatch': {'$': ((0,), 1), 'int': ((0,), 2), 'void': ((0,), 2)},
+    },
+    'declaration-list': {
+        'paths': (('declaration', '#semantic_refresh', 'declaration-list'), ('ε',)),
+        'first': (('int', 'void'), ('ε',)),
+        'follow': ('$', '(', ';', 'ID', 'NUM', 'break', 'if', 'repeat', 'return', '{', '}'),
+        'dispatch': {'$': ((1,), 0), '(': ((1,), 0), ';': ((1,), 0), 'ID': ((1,), 0), 'NUM': ((1,), 0), 'break': ((1,), 0), 'if': ((1,), 0), 'int': ((0,), 2), 'repeat': ((1,), 0), 'return': ((1,), 0), 'void': ((0,), 2), '{': ((1,), 0), '}': ((1,), 0)},
+    },
+    'declaration': {
+        'paths': (('declaration-initial', 'declaration-prime'),),
+        'first': (('int', 'void'),),
+        'follow': ('$', '(', ';', 'ID', 'NUM', 'break', 'if', 'int', 'repeat', 'return', 'void', '{', '}'),
+        'dispatch': {'$': ((), 0), '(': ((), 0), ';': ((), 0), 'ID': ((), 0), 'NUM': ((), 0), 'break': ((), 0), 'if': ((), 0), 'int': ((0,), 0), 'repeat': ((), 0), 'return': ((), 0), 'void': ((0,), 0), '{': ((), 0), '}': ((), 0)},
+    },
+    'declaration-initial': {
+        'paths': (('#push', 'type-specifier', '#push', 'ID'),),
+        'first': (('int', 'void'),),
+        'follow': ('(', ')', ',', ';', '['),
+        'dispatch': {'$': ((), 1), '(': ((), 0), ')': ((), 0), ',': ((), 0), ';': ((), 0), '[': ((), 0), 'int': ((0,), 2), 'void': ((0,), 2)},
+    },
+    'declaration-prime': {
+        'paths': (('fun-declaration-prime',), ('var-declaration-prime',)),
+        'first': (('(',), (';', '[')),
+        'follow': ('$', '(', ';', 'ID', 'NUM', 'break', 'if', 'int', 'repeat', 'return', 'void', '{', '}'),
+        'dispatch': {'$': ((), 0), '(': ((0,), 0), ';': ((1,), 0), 'ID': ((), 0), 'NUM': ((), 0), '[': ((1,), 2), 'break': ((), 0), 'if': ((), 0), 'int': ((), 0), 'repeat': ((), 0), 'return': ((), 0), 'void': ((), 0), '{': ((), 0), '}': ((), 0)},
+    },
+    'var-declaration-prime': {
+        'paths': (('#declare', ';'), ('[', '#push', 'NUM', ']', '#dec_arr', ';')),
+        'first': ((';',), ('[',)),
+        'follow': ('$', '(', ';', 'ID', 'NUM', 'break', 'if', 'int', 'repeat', 'return', 'void', '{', '}'),
+        'dispatch': {'$': ((), 0), '(': ((), 0), ';': ((0,), 0), 'ID': ((), 0), 'NUM': ((), 0), '[': ((1,), 2), 'break': ((), 0), 'if': ((), 0), 'int': ((), 0), 'repeat': ((), 0), 'return': ((), 0), 'void': ((), 0), '{': ((), 0), '}': ((), 0)},
+    },
+    'fun-declaration-prime': {
+        'paths': (('#dec_fun', '(', 'params', ')', 'compound-stmt', '#end_func'),),
+        'first': (('(',),),
+        'follow': ('$', '(', ';', 'ID', 'NUM', 'break', 'if', 'int', 'repeat', 'return', 'void', '{', '}'),
+        'dispatch': {'$': ((), 0), '(': ((0,), 0), ';': ((), 0), 'ID': ((), 0), 'NUM': ((), 0), 'break': ((), 0), 'if': ((), 0), 'int': ((), 0), 'repeat': ((), 0), 'return': ((), 0), 'void': ((), 0), '{': ((), 0), '}': ((), 0)},
+    },
+    'type-specifier': {
+        'paths': (('int',), ('void',)),
+        'first': (('int',), ('void',)),
+        'follow': ('ID',),
+        'dispatch': {'$': ((), 1), 'ID': ((), 0), 'int': ((0,), 2), 'void': ((1,), 2)},
+    },
+    'params': {
+        'paths': (('#push', 'int', '#push', 'ID', 'param-prime', 'param-list'), ('void',)),
+        'first': (('int',), ('void',)),
+        'follow': (')',),
+        'dispatch': {'$': ((), 1), ')': ((), 0), 'int': ((0,), 2), 'void': ((1,), 2)},
+    },
+    'param-list': {
+        'paths': ((',', 'param', 'param-list'), ('ε',)),
+        'first': ((',',), ('ε',)),
+        'follow': (')',),
+        'dispatch': {'$': ((), 1), ')': ((1,), 0), ',': ((0,), 2)},
+    },
+    'param': {
+        'paths': (('declaration-initial', 'param-prime'),),
+        'first': (('int', 'void'),),
+        'follow': (')', ','),
+        'dispatch': {'$': ((), 1), ')': ((), 0), ',': ((), 0), 'int': ((0,), 2), 'void': ((0,), 2)},
+    },
+    'param-prime': {
+        'paths': (('[', ']', '#dec_parr'), ('ε', '#dec_pvar')),
+        'first': (('[',), ('ε',)),
+        'follow': (')', ','),
+        'dispatch': {'$': ((), 1), ')': ((1,), 0), ',': ((1,), 0), '[': ((0,), 2)},
+    },
+    'compound-stmt': {
+        'paths': (('#start_scope', '{', 'declaration-list', 'statement-list', '}', '#finish_scope'),),
+        'first': (('{',),),
+        'follow': ('$', '(', ';', 'ID', 'NUM', 'break', 'else', 'endif', 'if', 'int', 'repeat', 'return', 'until', 'void', '{', '}'),
+        'dispatch': {'$': ((), 0), '(': ((), 0), ';': ((), 0), 'ID': ((), 0), 'NUM': ((), 0), 'break': ((), 0), 'else': ((), 0), 'endif': ((), 0), 'if': ((), 0), 'int': ((), 0), 'repeat': ((), 0), 'return': ((), 0), 'until': ((), 0), 'void': ((), 0), '{': ((0,), 0), '}': ((), 0)},
+    },
+    'statement-list': {
+        'paths': (('statement', '#semantic_refresh', 'statement-list'), ('ε',)),
+        'first': (('(', ';', 'ID', 'NUM', 'break', 'if', 'repeat', 'return', '{'), ('ε',)),
+        'follow': ('}',),
+        'dispatch': {'$': ((), 1), '(': ((0,), 2), ';': ((0,), 2), 'ID': ((0,), 2), 'NUM': ((0,), 2), 'break': ((0,), 2), 'if': ((0,), 2), 'repeat': ((0,), 2), 'return': ((0,), 2), '{': ((0,), 2), '}': ((1,), 0)},
+    },
+    'statement': {
+        'paths': (('expression-stmt',), ('return-stmt',), ('compound-stmt',), ('selection-stmt',), ('iteration-stmt',)),
+        'first': (('(', ';', 'ID', 'NUM', 'break'), ('return',), ('{',), ('if',), ('repeat',)),
+        'follow': ('(', ';', 'ID', 'NUM', 'break', 'else', 'endif', 'if', 'repeat', 'return', 'until', '{', '}'),
+        'dispatch': {'$': ((), 1), '(': ((0,), 0), ';': ((0,), 0), 'ID': ((0,), 0), 'NUM': ((0,), 0), 'break': ((0,), 0), 'else': ((), 0), 'endif': ((), 0), 'if': ((3,), 0), 'repeat': ((4,), 0), 'return': ((1,), 0), 'until': ((), 0), '{': ((2,), 0), '}': ((), 0)},
+    },
+    'expression-stmt': {
+        'paths': (('expression', '#pop3', ';'), ('break', '#scope_break', ';'), (';',)),
+        'first': (('(', 'ID', 'NUM'), ('break',), (';',)),
+        'follow': ('(', ';', 'ID', 'NUM', 'break', 'else', 'endif', 'if', 'repeat', 'return', 'until', '{', '}'),
+        'dispatch': {'$': ((), 1), '(': ((0,), 0), ';': ((2,), 0), 'ID': ((0,), 0), 'NUM': ((0,), 0), 'break': ((1,), 0), 'else': ((), 0), 'endif': ((), 0), 'if': ((), 0), 'repeat': ((), 0), 'return': ((), 0), 'until': ((), 0), '{': ((), 0), '}': ((), 0)},
+    },
+    'selection-stmt': {
+        'paths': (('if', '(', 'expression', ')', '#save', 'statement', 'else-stmt'),),
+        'first': (('if',),),
+        'follow': ('(', ';', 'ID', 'NUM', 'break', 'else', 'endif', 'if', 'repeat', 'return', 'until', '{', '}'),
+        'dispatch': {'$': ((), 1), '(': ((), 0), ';': ((), 0), 'ID': ((), 0), 'NUM': ((), 0), 'break': ((), 0), 'else': ((), 0), 'endif': ((), 0), 'if': ((0,), 0), 'repeat': ((), 0), 'return': ((), 0), 'until': ((), 0), '{': ((), 0), '}': ((), 0)},
+    },
+    'else-stmt': {
+        'paths': (('#fill_jpf', 'endif'), ('#ifc_action', 'else', 'statement', '#fill_jp', 'endif')),
+        'first': (('endif',), ('else',)),
+        'follow': ('(', ';', 'ID', 'NUM', 'break', 'else', 'endif', 'if', 'repeat', 'return', 'until', '{', '}'),
+        'dispatch': {'$': ((), 1), '(': ((), 0), ';': ((), 0), 'ID': ((), 0), 'NUM': ((), 0), 'break': ((), 0), 'else': ((1,), 0), 'endif': ((0,), 0), 'if': ((), 0), 'repeat': ((), 0), 'return': ((), 0), 'until': ((), 0), '{': ((), 0), '}': ((), 0)},
+    },
+    'iteration-stmt': {
+        'paths': (('#loop', 'repeat', 'statement', 'until', '(', 'expression', ')', '#until'),),
+        'first': (('repeat',),),
+        'follow': ('(', ';', 'ID', 'NUM', 'break', 'else', 'endif', 'if', 'repeat', 'return', 'until', '{', '}'),
+        'dispatch': {'$': ((), 1), '(': ((), 0), ';': ((), 0), 'ID': ((), 0), 'NUM': ((), 0), 'break': ((), 0), 'else': ((), 0), 'endif': ((), 0), 'if': ((), 0), 'repeat': ((0,), 0), 'return': ((), 0), 'until': ((), 0), '{': ((), 0), '}': ((), 0)},
+    },
+    'return-stmt': {
+        'paths': (('return', 'return-stmt-prime', '#fun_return'),),
+        'first': (('return',),),
+        'follow': ('(', ';', 'ID', 'NUM', 'break', 'else', 'endif', 'if', 'repeat', 'return', 'until', '{', '}'),
+        'dispatch': {'$': ((), 1), '(': ((), 0), ';': ((), 0), 'ID': ((), 0), 'NUM': ((), 0), 'break': ((), 0), 'else': ((), 0), 'endif': ((), 0), 'if': ((), 0), 'repeat': ((), 0), 'return': ((0,), 0), 'until': ((), 0), '{': ((), 0), '}': ((), 0)},
+    },
+    'return-stmt-prime': {
+        'paths': ((';',), ('expression', '#function_return', ';')),
+        'first': ((';',), ('(', 'ID', 'NUM')),
+        'follow': ('(', ';', 'ID', 'NUM', 'break', 'else', 'endif', 'if', 'repeat', 'return', 'until', '{', '}'),
+        'dispatch': {'$': ((), 1), '(': ((1,), 0), ';': ((0,), 0), 'ID': ((1,), 0), 'NUM': ((1,), 0), 'break': ((), 0), 'else': ((), 0), 'endif': ((), 0), 'if': ((), 0), 'repeat': ((), 0), 'return': ((), 0), 'until': ((), 0), '{': ((), 0), '}': ((), 0)},
+    },
+    'expression': {
+        'paths': (('simple-expression-zegond',), ('#pid', 'ID', 'b')),
+        'first': (('(', 'NUM'), ('ID',)),
+        'follow': (')', ',', ';', ']'),
+        'dispatch': {'$': ((), 1), '(': ((0,), 2), ')': ((), 0), ',': ((), 0), ';': ((), 0), 'ID': ((1,), 2), 'NUM': ((0,), 2), ']': ((), 0)},
+    },
+    'b': {
+        'paths': (('=', 'expression', '#assign'), ('[', 'expression', ']', '#parr', 'h'), ('simple-expression-prime',)),
+        'first': (('=',), ('[',), ('(', '*', '+', '-', '<', '==', 'ε')),
+        'follow': (')', ',', ';', ']'),
+        'dispatch': {'$': ((), 1), '(': ((2,), 2), ')': ((2,), 0), '*': ((2,), 2), '+': ((2,), 2), ',': ((2,), 0), '-': ((2,), 2), ';': ((2,), 0), '<': ((2,), 2), '=': ((0,), 2), '==': ((2,), 2), '[': ((1,), 2), ']': ((2,), 0)},
+    },
+    'h': {
+        'paths': (('=', 'expression', '#assign'), ('g', 'd', 'c')),
+        'first': (('=',), ('*', '+', '-', '<', '==', 'ε')),
+        'follow': (')', ',', ';', ']'),
+        'dispatch': {'$': ((), 1), ')': ((1,), 0), '*': ((1,), 2), '+': ((1,), 2), ',': ((1,), 0), '-': ((1,), 2), ';': ((1,), 0), '<': ((1,), 2), '=': ((0,), 2), '==': ((1,), 2), ']': ((1,), 0)},
+    },
+    'simple-expression-zegond': {
+        'paths': (('additive-expression-zegond', 'c'),),
+        'first': (('(', 'NUM'),),
+        'follow': (')', ',', ';', ']'),
+        'dispatch': {'$': ((), 1), '(': ((0,), 2), ')': ((), 0), ',': ((), 0), ';': ((), 0), 'NUM': ((0,), 2), ']': ((), 0)},
+    },
+    'simple-expression-prime': {
+        'paths': (('additive-expression-prime', 'c'),),
+        'first': (('(', '*', '+', '-', '<', '==', 'ε'),),
+        'follow': (')', ',', ';', ']'),
+        'dispatch': {'$': ((), 1), '(': ((0,), 2), ')': ((0,), 0), '*': ((0,), 2), '+': ((0,), 2), ',': ((0,), 0), '-': ((0,), 2), ';': ((0,), 0), '<': ((0,), 2), '==': ((0,), 2), ']': ((0,), 0)},
+    },
+    'c': {
+        'paths': (('relop', 'additive-expression', '#opera'), ('ε',)),
+        'first': (('<', '=='), ('ε',)),
+        'follow': (')', ',', ';', ']'),
+        'dispatch': {'$': ((), 1), ')': ((1,), 0), ',': ((1,), 0), ';': ((1,), 0), '<': ((0,), 2), '==': ((0,), 2), ']': ((1,), 0)},
+    },
+    'relop': {
+        'paths': (('#push', '<'), ('#push', '==')),
+        'first': (('<',), ('==',)),
+        'follow': ('(', 'ID', 'NUM'),
+        'dispatch': {'$': ((), 1), '(': ((), 0), '<': ((0,), 2), '==': ((1,), 2), 'ID': ((), 0), 'NUM': ((), 0)},
+    },
+    'additive-expression': {
+        'paths': (('term', 'd'),),
+        'first': (('(', 'ID', 'NUM'),),
+        'follow': (')', ',', ';', ']'),
+        'dispatch': {'$': ((), 1), '(': ((0,), 2), ')': ((), 0), ',': ((), 0), ';': ((), 0), 'ID': ((0,), 2), 'NUM': ((0,), 2), ']': ((), 0)},
+    },
+    'additive-expression-prime': {
+        'paths': (('term-prime', 'd'),),
+        'first': (('(', '*', '+', '-', 'ε'),),
+        'follow': (')', ',', ';', '<', '==', ']'),
+        'dispatch': {'$': ((), 1), '(': ((0,), 2), ')': ((0,), 0), '*': ((0,), 2), '+': ((0,), 2), ',': ((0,), 0), '-': ((0,), 2), ';': ((0,), 0), '<': ((0,), 0), '==': ((0,), 0), ']': ((0,), 0)},
+    },
+    'additive-expression-zegond': {
+        'paths': (('term-zegond', 'd'),),
+        'first': (('(', 'NUM'),),
+        'follow': (')', ',', ';', '<', '==', ']'),
+        'dispatch': {'$': ((), 1), '(': ((0,), 2), ')': ((), 0), ',': ((), 0), ';': ((), 0), '<': ((), 0), '==': ((), 0), 'NUM': ((0,), 2), ']': ((), 0)},
+    },
+    'd': {
+        'paths': (('addop', 'term', '#opera', 'd'), ('ε',)),
+        'first': (('+', '-'), ('ε',)),
+        'follow': (')', ',', ';', '<', '==', ']'),
+        'dispatch': {'$': ((), 1), ')': ((1,), 0), '+': ((0,), 2), ',': ((1,), 0), '-': ((0,), 2), ';': ((1,), 0), '<': ((1,), 0), '==': ((1,), 0), ']': ((1,), 0)},
+    },
+    'addop': {
+        'paths': (('#push', '+'), ('#push', '-')),
+        'first': (('+',), ('-',)),
+        'follow': ('(', 'ID', 'NUM'),
+        'dispatch': {'$': ((), 1), '(': ((), 0), '+': ((0,), 2), '-': ((1,), 2), 'ID': ((), 0), 'NUM': ((), 0)},
+    },
+    'term': {
+        'paths': (('factor', 'g'),),
+        'first': (('(', 'ID', 'NUM'),),
+        'follow': (')', '+', ',', '-', ';', '<', '==', ']'),
+        'dispatch': {'$': ((), 1), '(': ((0,), 2), ')': ((), 0), '+': ((), 0), ',': ((), 0), '-': ((), 0), ';': ((), 0), '<': ((), 0), '==': ((), 0), 'ID': ((0,), 2), 'NUM': ((0,), 2), ']': ((), 0)},
+    },
+    'term-prime': {
+        'paths': (('factor-prime', 'g'),),
+        'first': (('(', '*', 'ε'),),
+        'follow': (')', '+', ',', '-', ';', '<', '==', ']'),
+        'dispatch': {'$': ((), 1), '(': ((0,), 2), ')': ((0,), 0), '*': ((0,), 2), '+': ((0,), 0), ',': ((0,), 0), '-': ((0,), 0), ';': ((0,), 0), '<': ((0,), 0), '==': ((0,), 0), ']': ((0,), 0)},
+    },
+    'term-zegond': {
+        'paths': (('factor-zegond', 'g'),),
+        'first': (('(', 'NUM'),),
+        'follow': (')', '+', ',', '-', ';', '<', '==', ']'),
+        'dispatch': {'$': ((), 1), '(': ((0,), 2), ')': ((), 0), '+': ((), 0), ',': ((), 0), '-': ((), 0), ';': ((), 0), '<': ((), 0), '==': ((), 0), 'NUM': ((0,), 2), ']': ((), 0)},
+    },
+    'g': {
+        'paths': (('#push', '*', 'factor', '#opera', 'g'), ('ε',)),
+        'first': (('*',), ('ε',)),
+        'follow': (')', '+', ',', '-', ';', '<', '==', ']'),
+        'dispatch': {'$': ((), 1), ')': ((1,), 0), '*': ((0,), 2), '+': ((1,), 0), ',': ((1,), 0), '-': ((1,), 0), ';': ((1,), 0), '<': ((1,), 0), '==': ((1,), 0), ']': ((1,), 0)},
+    },
+    'factor': {
+        'paths': (('(', 'expression', ')'), ('#pid', 'ID', 'var-call-prime'), ('#pnum', 'NUM')),
+        'first': (('(',), ('ID',), ('NUM',)),
+        'follow': (')', '*', '+', ',', '-', ';', '<', '==', ']'),
+        'dispatch': {'$': ((), 1), '(': ((0,), 2), ')': ((), 0), '*': ((), 0), '+': ((), 0), ',': ((), 0), '-': ((), 0), ';': ((), 0), '<': ((), 0), '==': ((), 0), 'ID': ((1,), 2), 'NUM': ((2,), 2), ']': ((), 0)},
+    },
+    'var-call-prime': {
+        'paths': (('(', 'args', ')', '#call'), ('var-prime',)),
+        'first': (('(',), ('[', 'ε')),
+        'follow': (')', '*', '+', ',', '-', ';', '<', '==', ']'),
+        'dispatch': {'$': ((), 1), '(': ((0,), 2), ')': ((1,), 0), '*': ((1,), 0), '+': ((1,), 0), ',': ((1,), 0), '-': ((1,), 0), ';': ((1,), 0), '<': ((1,), 0), '==': ((1,), 0), '[': ((1,), 2), ']': ((1,), 0)},
+    },
+    'var-prime': {
+        'paths': (('[', 'expression', ']', '#parr'), ('ε',)),
+        'first': (('[',), ('ε',)),
+        'follow': (')', '*', '+', ',', '-', ';', '<', '==', ']'),
+        'dispatch': {'$': ((), 1), ')': ((1,), 0), '*': ((1,), 0), '+': ((1,), 0), ',': ((1,), 0), '-': ((1,), 0), ';': ((1,), 0), '<': ((1,), 0), '==': ((1,), 0), '[': ((0,), 2), ']': ((1,), 0)},
+    },
+    'factor-prime': {
+        'paths': (('(', 'args', ')', '#call'), ('ε',)),
+        'first': (('(',), ('ε',)),
+        'follow': (')', '*', '+', ',', '-', ';', '<', '==', ']'),
+        'dispatch': {'$': ((), 1), '(': ((0,), 2), ')': ((1,), 0), '*': ((1,), 0), '+': ((1,), 0), ',': ((1,), 0), '-': ((1,), 0), ';': ((1,), 0), '<': ((1,), 0), '==': ((1,), 0), ']': ((1,), 0)},
+    },
+    'factor-zegond': {
+        'paths': (('(', 'expression', ')'), ('#pnum', 'NUM')),
+        'first': (('(',), ('NUM',)),
+        'follow': (')', '*', '+', ',', '-', ';', '<', '==', ']'),
+        'dispatch': {'$': ((), 1), '(': ((0,), 2), ')': ((), 0), '*': ((), 0), '+': ((), 0), ',': ((), 0), '-': ((), 0), ';': ((), 0), '<': ((), 0), '==': ((), 0), 'NUM': ((1,), 2), ']': ((), 0)},
+    },
+    'args': {
+        'paths': (('arg-list',), ('ε',)),
+        'first': (('(', 'ID', 'NUM'), ('ε',)),
+        'follow': (')',),
+        'dispatch': {'$': ((), 1), '(': ((0,), 2), ')': ((1,), 0), 'ID': ((0,), 2), 'NUM': ((0,), 2)},
+    },
+    'arg-list': {
+        'paths': (('expression', '#add_args', 'arg-list-prime'),),
+        'first': (('(', 'ID', 'NUM'),),
+        'follow': (')',),
+        'dispatch': {'$': ((), 1), '(': ((0,), 2), ')': ((), 0), 'ID': ((0,), 2), 'NUM': ((0,), 2)},
+    },
+    'arg-list-prime': {
+        'paths': ((',', 'expression', '#add_args', 'arg-list-prime'), ('ε',)),
+        'first': ((',',), ('ε',)),
+        'follow': (')',),
+        'dispatch': {'$': ((), 1), ')': ((1,), 0), ',': ((0,), 2)},
+    },
+}
@@ -1,421 +1,297 @@
-from anytree import NodeMixin
+from array import array
 
+import tablegen
 from toMC import CodeGen
+from peephole import PATTERNS
 
 
-class ParserNode(NodeMixin):
+class ParseTree:
+    node_class = None
 
-    def __init__(self, name, parent=None, children=None, **kwargs):
-        self.__dict__.update(kwargs)
-        if children:
-            self.children = children
+    def __init__(self, none_terminals):
+        self.none_terminals = none_terminals
+        self.names, self.ids = [], {}
+        self.symbols, self.tokens = array('i'), array('i')
+        self.first_child, self.next_sibling = array('i'), array('i')
+        self.root = -1
 
-        self.name = name
-        self.parent = parent
+    def add(self, name, token=-1):
+        symbol = self.ids.get(name)
+        if symbol is None:
+            symbol = self.ids[name] = len(self.names)
+            self.names.append(name)
 
-    @classmethod
-    def set_nts(cls, none_terminals):
-        cls.none_terminals = none_terminals
+        self.symbols.append(symbol)
+        self.tokens.append(token)
+        self.first_child.append(-1)
+        self.next_sibling.append(-1)
+        return len(self.symbols) - 1
+
+    def attach(self, node, children):
+        self.first_child[node] = children[0]
+        for child, sibling in zip(children, children[1:]):
+            self.next_sibling[child] = sibling
+
+    def name(self, node):
+        name = self.names[self.symbols[node]]
+        return name.capitalize() if name in self.none_terminals else name
+
+    def children(self, node):
+        child = self.first_child[node]
+        while child != -1:
+            yield child
+            child = self.next_sibling[child]
+
+    def walk(self, node=None):
+        stack = [(self.root if node is None else node, 0)]
+
+        while stack:
+            node, depth = stack.pop()
+            yield node, depth
+            stack.extend((child, depth + 1) for child in reversed(list(self.children(node))))
+
+    def __iter__(self):
+        return (node for node, _ in self.walk())
+
+    def __len__(self):
+        return sum(1 for _ in self.walk())
+
+    def render(self):
+        lines, stack = [], [(self.root, '', '')]
+
+        while stack:
+            node, prefix, fill = stack.pop()
+            lines.append(prefix + self.name(node))
+
+            children = list(self.children(node))
+            for index in range(len(children) - 1, -1, -1):
+                last = index == len(children) - 1
+                stack.append((
+                    children[index],
+                    fill + ('└── ' if last else '├── '),
+                    fill + ('    ' if last else '│   ')
+                ))
+
+        return '\n'.join(lines)
+
+    def to_anytree(self, node=None):
+        if ParseTree.node_class is None:
+            from anytree import NodeMixin
+
+            class ParserNode(NodeMixin):
 
-    def __repr__(self):
-        return self.name.capitalize() \
-            if self.name in self.none_terminals else self.name
+                def __init__(self, name, parent=None, display=None):
+                    self.name, self.display = name, display or name
+                    self.parent = parent
+
+                def __repr__(self):
+                    return self.display
+
+            ParseTree.node_class = ParserNode
+
+        node = self.root if node is None else node
+        root = self.node_class(self.names[self.symbols[node]], display=self.name(node))
+        stack = [(node, root)]
+
+        while stack:
+            node, parent = stack.pop()
+            for child in self.children(node):
+                stack.append((child, self.node_class(
+                    self.names[self.symbols[child]], parent=parent, display=self.name(child))))
+
+        return root
 
 
 class Parser:
+    ACTION, NONE_TERMINAL, TERMINAL = range(3)
+    MISSING, EOF, ILLEGAL = tablegen.MISSING, tablegen.EOF, tablegen.ILLEGAL
+    states = dispatch = None
+
+    class Frame:
+        __slots__ = ('state', 'next', 'path', 'position', 'children')
+
+        def __init__(self, state):
+            self.state, self.next = state, 0
+            self.path, self.position, self.children = None, 0, None
 
-    def __init__(self, scanner):
-        self.get_next_token = (
-            (token.token if token.token in {'NUM', 'ID'} else token.lexeme, token, token.lineno)
-            for token in scanner.get_next_token()
-        )
-
-        cg = CodeGen(self)
-        self.cg = cg
-
-        self.states = {
-            'program': {
-                'transition': [{'path': [cg.start_program, 'declaration-list', '$', cg.end_program],
-                                'first': ['$', 'int', 'void']}], 'follow': [],
-            },
-            'declaration-list': {
-                'transition': [
-                    {'path': ['declaration', cg.semantic_refresh, 'declaration-list'], 'first': ['int', 'void']},
-                    {'path': ['ε'], 'first': ['ε']},
-                ],
-                'follow': ['break', ';', 'ID', '(', 'NUM', 'if', 'return', '{', '}', 'repeat', '$'],
-            },
-            'declaration': {
-                'transition': [
-                    {'path': ['declaration-initial', 'declaration-prime'], 'first': ['int', 'void']},
-                ],
-                'follow': ['int', 'void', 'break', ';', 'ID', '(', 'NUM', 'if', 'return', '{', '}', 'repeat', '$'],
-            },
-            'declaration-initial': {
-                'transition': [
-                    {'path': [cg.push, 'type-specifier', cg.push, 'ID'], 'first': ['int', 'void']},
-                ], 'follow': ['[', '(', ';', ',', ')'],
-            },
-            'declaration-prime': {
-                'transition': [
-                    {'path': ['fun-declaration-prime'], 'first': ['(']},
-                    {'path': ['var-declaration-prime'], 'first': [';', '[']},
-                ],
-                'follow': ['int', 'void', 'break', ';', 'ID', '(', 'NUM', 'if', 'return', '{', '}', 'repeat', '$'],
-            },
-            'var-declaration-prime': {
-                'transition': [
-                    {'path': [cg.declare, ';'], 'first': [';']},
-                    {'path': ['[', cg.push, 'NUM', ']', cg.dec_arr, ';'], 'first': ['[']},
-                ],
-                'follow': ['int', 'void', 'break', ';', 'ID', '(', 'NUM', 'if', 'return', '{', '}', 'repeat', '$'],
-            },
-            'fun-declaration-prime': {
-                'transition': [
-                    {'path': [cg.dec_fun, '(', 'params', ')', 'compound-stmt', cg.end_func], 'first': ['(']},
-                ],
-                'follow': ['int', 'void', 'break', ';', 'ID', '(', 'NUM', 'if', 'return', '{', '}', 'repeat', '$'],
-            },
-            'type-specifier': {
-                'transition': [
-                    {'path': ['int'], 'first': ['int']},
-                    {'path': ['void'], 'first': ['void']},
-                ], 'follow': ['ID'],
-            },
-            'params': {
-                'transition': [
-                    {'path': [cg.push, 'int', cg.push, 'ID', 'param-prime', 'param-list'], 'first': ['int']},
-                    {'path': ['void'], 'first': ['void']},
-                ], 'follow': [')'],
-            },
-            'param-list': {
-                'transition': [
-                    {'path': [',', 'param', 'param-list'], 'first': [',']},
-                    {'path': ['ε'], 'first': ['ε']},
-                ], 'follow': [')'],
-            },
-            'param': {
-                'transition': [
-                    {'path': ['declaration-initial', 'param-prime'], 'first': ['int', 'void']},
-                ], 'follow': [',', ')'],
-            },
-            'param-prime': {
-                'transition': [
-                    {'path': ['[', ']', cg.dec_parr], 'first': ['[']},
-                    {'path': ['ε', cg.dec_pvar], 'first': ['ε']},
-                ], 'follow': [',', ')'],
-            },
-            'compound-stmt': {
-                'transition': [
-                    {'path': [cg.start_scope, '{', 'declaration-list', 'statement-list', '}', cg.finish_scope],
-                     'first': ['{']},
-                ],
-                'follow': [
-                    'until', 'endif', 'else', 'break', ';', 'ID', '(', 'NUM',
-                    'if', 'return', '{', '}', 'repeat', 'int', 'void', '$'
-                ],
-            },
-            'statement-list': {
-                'transition': [
-                    {
-                        'path': ['statement', cg.semantic_refresh, 'statement-list'],
-                        'first': ['break', ';', 'ID', '(', 'NUM', 'if', 'return', '{', 'repeat']
-                    },
-                    {'path': ['ε'], 'first': ['ε']},
-                ], 'follow': ['}'],
-            },
-            'statement': {
-                'transition': [
-                    {'path': ['expression-stmt'], 'first': ['break', ';', 'ID', '(', 'NUM']},
-                    {'path': ['return-stmt'], 'first': ['return']},
-                    {'path': ['compound-stmt'], 'first': ['{']},
-                    {'path': ['selection-stmt'], 'first': ['if']},
-                    {'path': ['iteration-stmt'], 'first': ['repeat']},
-                ],
-                'follow': [
-                    'until', 'endif', 'else', 'break', ';', 'ID', '(', 'NUM',
-                    'if', 'return', '{', 'repeat', '}'
-                ],
-            },
-            'expression-stmt': {
-                'transition': [
-                    {'path': ['expression', cg.pop3, ';'], 'first': ['ID', '(', 'NUM']},
-                    {'path': ['break', cg.scope_break, ';'], 'first': ['break']},
-                    {'path': [';'], 'first': [';']},
-                ],
-                'follow': [
-                    'until', 'endif', 'else', 'break', ';', 'ID', '(', 'NUM',
-                    'if', 'return', '{', 'repeat', '}'
-                ],
-            },
-            'selection-stmt': {
-                'transition': [
-                    {
-                        'path': ['if', '(', 'expression', ')', cg.save, 'statement', 'else-stmt'],
-                        'first': ['if']
-                    },
-                ],
-                'follow': [
-                    'until', 'endif', 'else', 'break', ';', 'ID', '(', 'NUM',
-                    'if', 'return', '{', 'repeat', '}'
-                ],
-            },
-            'else-stmt': {
-                'transition': [
-                    {'path': [cg.fill_jpf, 'endif'], 'first': ['endif']},
-                    {'path': [cg.ifc_action, 'else', 'statement', cg.fill_jp, 'endif'], 'first': ['else']},
-                ],
-                'follow': [
-                    'until', 'endif', 'else', 'break', ';', 'ID', '(', 'NUM',
-                    'if', 'return', '{', 'repeat', '}'
-                ],
-            },
-            'iteration-stmt': {
-                'transition': [
-                    {
-                        'path': [cg.loop, 'repeat', 'statement', 'until', '(', 'expression', ')', cg.until],
-                        'first': ['repeat']
-                    },
-                ],
-                'follow': [
-                    'until', 'endif', 'else', 'break', ';', 'ID', '(', 'NUM',
-                    'if', 'return', '{', 'repeat', '}'
-                ],
-            },
-            'return-stmt': {
-                'transition': [
-                    {'path': ['return', 'return-stmt-prime', cg.fun_return], 'first': ['return']},
-                ],
-                'follow': [
-                    'until', 'endif', 'else', 'break', ';', 'ID', '(', 'NUM',
-                    'if', 'return', '{', 'repeat', '}'
-                ],
-            },
-            'return-stmt-prime': {
-                'transition': [
-                    {'path': [';'], 'first': [';']},
-                    {'path': ['expression', cg.function_return, ';'], 'first': ['ID', '(', 'NUM']},
-                ],
-                'follow': [
-                    'until', 'endif', 'else', 'break', ';', 'ID', '(', 'NUM',
-                    'if', 'return', '{', 'repeat', '}'
-                ],
-            },
-            'expression': {
-                'transition': [
-                    {'path': ['simple-expression-zegond'], 'first': ['(', 'NUM']},
-                    {'path': [cg.pid, 'ID', 'b'], 'first': ['ID']},
-                ], 'follow': [',', ')', ']', ';'],
-            },
-            'b': {
-                'transition': [
-                    {'path': ['=', 'expression', cg.assign], 'first': ['=']},
-                    {'path': ['[', 'expression', ']', cg.parr, 'h'], 'first': ['[']},
-                    {'path': ['simple-expression-prime'], 'first': ['(', 'ε', '*', '+', '-', '<', '==']},
-                ], 'follow': [',', ')', ']', ';'],
-            },
-            'h': {
-                'transition': [
-                    {'path': ['=', 'expression', cg.assign], 'first': ['=']},
-                    {'path': ['g', 'd', 'c'], 'first': ['*', '==', '<', '+', '-', 'ε']},
-                ], 'follow': [',', ')', ']', ';'],
-            },
-            'simple-expression-zegond': {
-                'transition': [
-                    {'path': ['additive-expression-zegond', 'c'], 'first': ['(', 'NUM']},
-                ], 'follow': [',', ')', ']', ';'],
-            },
-            'simple-expression-prime': {
-                'transition': [
-                    {
-                        'path': ['additive-expression-prime', 'c'],
-                        'first': ['(', 'ε', '*', '+', '-', '<', '==']
-                    },
-                ],
-                'follow': [',', ')', ']', ';'],
-            },
-            'c': {
-                'transition': [
-                    {'path': ['relop', 'additive-expression', cg.opera], 'first': ['<', '==']},
-                    {'path': ['ε'], 'first': ['ε']},
-                ], 'follow': [',', ')', ']', ';'],
-            },
-            'relop': {
-                'transition': [
-                    {'path': [cg.push, '<'], 'first': ['<']},
-                    {'path': [cg.push, '=='], 'first': ['==']},
-                ], 'follow': ['(', 'ID', 'NUM'],
-            },
-            'additive-expression': {
-                'transition': [
-                    {'path': ['term', 'd'], 'first': ['(', 'ID', 'NUM']},
-                ], 'follow': [',', ')', ']', ';'],
-            },
-            'additive-expression-prime': {
-                'transition': [
-                    {'path': ['term-prime', 'd'], 'first': ['(', 'ε', '*', '+', '-']},
-                ], 'follow': ['<', '==', ',', ')', ']', ';'],
-            },
-            'additive-expression-zegond': {
-                'transition': [
-                    {'path': ['term-zegond', 'd'], 'first': ['(', 'NUM']},
-                ], 'follow': ['<', '==', ',', ')', ']', ';'],
-            },
-            'd': {
-                'transition': [
-                    {'path': ['addop', 'term', cg.opera, 'd'], 'first': ['+', '-']},
-                    {'path': ['ε'], 'first': ['ε']},
-                ], 'follow': ['<', '==', ',', ')', ']', ';'],
-            },
-            'addop': {
-                'transition': [
-                    {'path': [cg.push, '+'], 'first': ['+']},
-                    {'path': [cg.push, '-'], 'first': ['-']},
-                ], 'follow': ['(', 'ID', 'NUM'],
-            },
-            'term': {
-                'transition': [
-                    {'path': ['factor', 'g'], 'first': ['(', 'ID', 'NUM']},
-                ], 'follow': ['+', '-', '<', '==', ',', ')', ']', ';'],
-            },
-            'term-prime': {
-                'transition': [
-                    {'path': ['factor-prime', 'g'], 'first': ['(', 'ε', '*']},
-                ], 'follow': ['+', '-', '<', '==', ',', ')', ']', ';'],
-            },
-            'term-zegond': {
-                'transition': [
-                    {'path': ['factor-zegond', 'g'], 'first': ['(', 'NUM']},
-                ], 'follow': ['+', '-', '<', '==', ',', ')', ']', ';'],
-            },
-            'g': {
-                'transition': [
-                    {'path': [cg.push, '*', 'factor', cg.opera, 'g'], 'first': ['*']},
-                    {'path': ['ε'], 'first': ['ε']},
-                ], 'follow': ['+', '-', '<', '==', ',', ')', ']', ';'],
-            },
-            'factor': {
-                'transition': [
-                    {'path': ['(', 'expression', ')'], 'first': ['(']},
-                    {'path': [cg.pid, 'ID', 'var-call-prime'], 'first': ['ID']},
-                    {'path': [cg.pnum, 'NUM'], 'first': ['NUM']},
-                ], 'follow': ['*', '<', '==', '+', '-', ',', ')', ']', ';'],
-            },
-            'var-call-prime': {
-                'transition': [
-                    {'path': ['(', 'args', ')', cg.call], 'first': ['(']},
-                    {'path': ['var-prime'], 'first': ['[', 'ε']},
-                ], 'follow': ['*', '<', '==', '+', '-', ',', ')', ']', ';'],
-            },
-            'var-prime': {
-                'transition': [
-                    {'path': ['[', 'expression', ']', cg.parr], 'first': ['[']},
-                    {'path': ['ε'], 'first': ['ε']},
-                ], 'follow': ['*', '<', '==', '+', '-', ',', ')', ']', ';'],
-            },
-            'factor-prime': {
-                'transition': [
-                    {'path': ['(', 'args', ')', cg.call], 'first': ['(']},
-                    {'path': ['ε'], 'first': ['ε']},
-                ], 'follow': ['*', '<', '==', '+', '-', ',', ')', ']', ';'],
-            },
-            'factor-zegond': {
-                'transition': [
-                    {'path': ['(', 'expression', ')'], 'first': ['(']},
-                    {'path': [cg.pnum, 'NUM'], 'first': ['NUM']},
-                ], 'follow': ['*', '<', '==', '+', '-', ',', ')', ']', ';'],
-            },
-            'args': {
-                'transition': [
-                    {'path': ['arg-list'], 'first': ['ID', '(', 'NUM']},
-                    {'path': ['ε'], 'first': ['ε']},
-                ], 'follow': [')'],
-            },
-            'arg-list': {
-                'transition': [
-                    {'path': ['expression', cg.add_args, 'arg-list-prime'], 'first': ['ID', '(', 'NUM']},
-                ], 'follow': [')'],
-            },
-            'arg-list-prime': {
-                'transition': [
-                    {'path': [',', 'expression', cg.add_args, 'arg-list-prime'], 'first': [',']},
-                    {'path': ['ε'], 'first': ['ε']},
-                ], 'follow': [')'],
-            },
-        }
-
-        for state in self.states:
-            firsts = set()
-            for transition in self.states[state]['transition']:
-                transition['first'] = set(transition['first'])
-                firsts.update(transition['first'])
-
-            self.states[state]['first'] = firsts
-
-        self.lookahead, self.token, self.lineno = next(self.get_next_token)
+    def __init__(self, scanner, build_tree=False, max_errors=None, directory='.', peephole=PATTERNS):
+        self.scanner, self.tokens = scanner, scanner.tokens
+        self.build_tree = build_tree
+        self.max_errors, self.aborted = max_errors, False
+        self.blocks = scanner.scan()
+        self.cursor, self.index = 0, None
+
+        self.symbol_table = scanner.symbol_table
+
+        self.cg = CodeGen(self, directory, peephole)
+        if Parser.states is None:
+            Parser.states = tablegen.load()
+            Parser.dispatch = Parser.compile()
+
+        self.advance()
         self.none_terminals = set(self.states)
         self.errors, self.up_stack = [], []
         self.actions = []
         self.parsing = True
         self.pid, self.cnt = None, 0
         self.lineno_prev = self.lineno
-        ParserNode.set_nts(self.none_terminals)
+        self.tree = ParseTree(self.none_terminals) if build_tree else None
+
+    @property
+    def token(self):
+        if self.index is None:
+            return self.scanner.Token('$', 'KEYWORD', self.lineno)
+
+        return self.tokens[self.index]
+
+    def advance(self):
+        while self.cursor >= len(self.tokens):
+            self.cursor = next(self.blocks, None)
 
-    def match(self, entry, before):
+            if self.cursor is None:
+                self.lookahead, self.lineno, self.index = '$', self.scanner.lineno, None
+                return
 
-        if entry in self.none_terminals: return self.proc(entry, before)
+        self.index, self.cursor = self.cursor, self.cursor + 1
+        self.lookahead = self.tokens.terminal(self.index)
+        self.lineno = self.tokens.linenos[self.index]
+
+    def match(self, entry):
 
         if self.lookahead != entry and entry != 'ε':
-            name = entry.capitalize() if entry in self.none_terminals else entry
-            self.errors.append({'message': F'missing {name}', 'lineno': self.lineno})
+            self.error(F'missing {entry}')
             return
 
+        if not self.build_tree:
+            if entry not in {'$', 'ε'} and self.lookahead != '$':
+                self.advance()
+            return True
+
         name = 'epsilon' if entry == 'ε' else '$' if entry == '$' else str(self.token)
+        token = self.index if entry not in {'$', 'ε'} and self.index is not None else -1
         if entry not in {'$', 'ε'} and self.lookahead != '$':
-            self.lookahead, self.token, self.lineno = next(self.get_next_token)
+            self.advance()
 
-        return ParserNode(name)
+        return self.tree.add(name, token)
 
-    def proc(self, state='program', before=None):
+    @classmethod
+    def compile(cls):
+        dispatch = {}
 
-        current = ParserNode(state, parent=before)
+        for name, state in cls.states.items():
+            paths = [
+                tuple((cls.ACTION, getattr(CodeGen, entry[1:])) if entry.startswith('#') else
+                      (cls.NONE_TERMINAL if entry in cls.states else cls.TERMINAL, entry)
+                      for entry in path)
+                for path in state['paths']
+            ]
 
-        for transition in self.states[state]['transition']:
-            if self.lookahead in transition['first'] or \
-                    (self.lookahead in self.states[state]['follow'] and 'ε' in transition['first']):
+            dispatch[name] = {
+                terminal: (tuple((index, paths[index]) for index in candidates), recovery)
+                for terminal, (candidates, recovery) in state['dispatch'].items()
+            }
 
-                children = []
-                for entry in transition['path']:
-                    if self.parsing:
-                        if type(entry) == str:
-                            children.append(self.match(entry, current))
-                            continue
+        return dispatch
 
-                        if self.lineno != self.lineno_prev:
-                            self.cg.semantic_refresh()
-                            self.lineno_prev = self.lineno
+    def error(self, message):
+        self.errors.append({'message': message, 'lineno': self.lineno})
 
-                        entry()
-                        self.actions.append(entry.__name__)
+        if self.max_errors is not None and len(self.errors) >= self.max_errors:
+            self.parsing, self.aborted = False, True
 
-                children = [child for child in children if child]
-                if children:
-                    return ParserNode(state, children=children)
+    def select(self, frame):
+        sync = self.dispatch[frame.state]
+        candidates, recovery = sync.get(self.lookahead, ((), self.ILLEGAL))
 
-        if self.lookahead in self.states[state]['follow']:
-            self.errors.append(
-                {'message': F'missing {state.capitalize() if state in self.none_terminals else state}',
-                 'lineno': self.lineno}
-            )
-            return
+        for index, path in candidates:
+            if index >= frame.next:
+                frame.next = index + 1
+                frame.path, frame.position, frame.children = path, 0, []
+                return True
 
-        if self.lookahead == '$':
-            self.errors.append({'message': 'Unexpected EOF', 'lineno': self.lineno})
+        frame.path = None
+        if recovery == self.MISSING:
+            self.error(F'missing {frame.state.capitalize()}')
+            return False
+
+        if recovery == self.EOF:
+            self.error('Unexpected EOF')
             self.parsing = False
-            return
+            return False
+
+        self.error(F'illegal {self.lookahead}')
+        self.advance()
+
+        while self.lookahead not in sync and not self.aborted:
+            self.error(F'illegal {self.lookahead}')
+            self.advance()
+
+        frame.next = 0
+        return not self.aborted
+
+    def proc(self, state='program'):
+        stack, result = [self.Frame(state)], None
+
+        while stack and not self.aborted:
+            frame = stack[-1]
+
+            if frame.path is None:
+                if self.select(frame):
+                    continue
+
+                stack.pop()
+                result = None
+
+            elif frame.position < len(frame.path):
+                kind, entry = frame.path[frame.position]
+                frame.position += 1
+
+                if not self.parsing:
+                    frame.position = len(frame.path)
+
+                elif kind == self.ACTION:
+                    if self.lineno != self.lineno_prev:
+                        self.cg.semantic_refresh()
+                        self.lineno_prev = self.lineno
+
+                    entry(self.cg)
+                    self.actions.append(entry.__name__)
+
+                elif kind == self.NONE_TERMINAL:
+                    stack.append(self.Frame(entry))
+
+                else:
+                    frame.children.append(self.match(entry))
+
+                continue
+
+            else:
+                if not self.build_tree:
+                    if not any(frame.children):
+                        frame.path = None
+                        continue
+
+                    stack.pop()
+                    result = True
+
+                else:
+                    children = [child for child in frame.children if child is not None]
+                    if not children:
+                        frame.path = None
+                        continue
+
+                    stack.pop()
+                    result = self.tree.add(frame.state)
+                    self.tree.attach(result, children)
+
+            if stack:
+                stack[-1].children.append(result)
+
+        if self.aborted:
+            return None
 
-        else:
-            self.errors.append({'message': F'illegal {self.lookahead}', 'lineno': self.lineno})
+        if not self.build_tree or result is None:
+            return result
 
-        self.lookahead, self.token, self.lineno = next(self.get_next_token)
-        return self.proc(state)
+        self.tree.root = result
+        return self.tree
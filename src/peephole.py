@@ -0,0 +1,110 @@
+from array import array
+
+from ir import Operand, DIRECT, IMMEDIATE, CODE, LABEL
+from ir import ADD, SUB, ASSIGN, JP, JPF
+
+PATTERNS = ('copy', 'zero', 'thread', 'next')
+
+
+class Peephole:
+
+    def __init__(self, patterns=PATTERNS):
+        unknown = set(patterns) - set(PATTERNS)
+        if unknown:
+            raise ValueError(F'unknown peephole patterns: {", ".join(sorted(unknown))}')
+
+        self.patterns = frozenset(patterns)
+        self.statistics = dict.fromkeys(PATTERNS, 0)
+
+    def run(self, program, temporaries=()):
+        keep = bytearray(b'\1') * len(program.ops)
+        targets = {
+            operand.value for operand in set(program.operands)
+            if operand.__class__ is Operand and operand.mode in (CODE, LABEL)
+        }
+
+        if 'thread' in self.patterns:
+            self.thread(program)
+
+        if 'zero' in self.patterns:
+            self.zero(program, keep)
+
+        if 'copy' in self.patterns:
+            self.copy(program, keep, targets, temporaries)
+
+        if 'next' in self.patterns:
+            self.next(program, keep)
+
+        return program.compact(keep)
+
+    def thread(self, program):
+        ops, operands = program.ops, program.operands
+
+        for line, op in enumerate(ops):
+            if op != JP and op != JPF:
+                continue
+
+            slot = 3 * line + (0 if op == JP else 1)
+            target, seen = operands[slot], {line}
+            while target.mode == CODE and target.value < len(ops) and ops[target.value] == JP \
+                    and target.value not in seen:
+                seen.add(target.value)
+                target = operands[3 * target.value]
+
+            if target is not operands[slot] and target.mode == CODE:
+                operands[slot] = target
+                self.statistics['thread'] += 1
+
+    def zero(self, program, keep):
+        ops, operands = program.ops, program.operands
+
+        for line, op in enumerate(ops):
+            if op != ADD and op != SUB:
+                continue
+
+            a, b, c = operands[3 * line:3 * line + 3]
+            if a.__class__ is not Operand or b.__class__ is not Operand:
+                continue
+
+            if (a is c and b.mode == IMMEDIATE and b.value == 0) or \
+                    (op == ADD and b is c and a.mode == IMMEDIATE and a.value == 0):
+                keep[line] = 0
+                self.statistics['zero'] += 1
+
+    def copy(self, program, keep, targets, temporaries):
+        ops, operands = program.ops, program.operands
+        _, last, pinned = program.intervals(temporaries)
+        previous = None
+
+        for line, op in enumerate(ops):
+            if not keep[line]:
+                if line in targets:
+                    previous = None
+                continue
+
+            if previous is not None and line not in targets and op == ASSIGN:
+                source, destination = operands[3 * line], operands[3 * line + 1]
+                if source is operands[previous] and source.__class__ is Operand and source.mode == DIRECT \
+                        and source.value in last and source.value not in pinned and last[source.value] == line \
+                        and destination.value != source.value:
+                    operands[previous] = destination
+                    keep[line] = 0
+                    self.statistics['copy'] += 1
+                    continue
+
+            previous = 3 * line + (1 if op == ASSIGN else 2) if op <= ASSIGN else None
+
+    def next(self, program, keep):
+        ops, operands = program.ops, program.operands
+        following = array('i', range(len(ops) + 1))
+
+        for line in range(len(ops) - 1, -1, -1):
+            op = ops[line]
+            if keep[line] and (op == JP or op == JPF):
+                target = operands[3 * line + (0 if op == JP else 1)]
+                if target.mode == CODE and line < target.value <= len(ops) and \
+                        following[target.value] == following[line + 1]:
+                    keep[line] = 0
+                    self.statistics['next'] += 1
+
+            following[line] = line if keep[line] else following[line + 1]
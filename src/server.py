@@ -0,0 +1,196 @@
+import os
+import sys
+import json
+import time
+import signal
+import asyncio
+import argparse
+
+from concurrent.futures import ProcessPoolExecutor
+
+from compiler import compile_source
+
+MAX_SOURCE = 1 << 20
+TIMEOUT = 10.0
+QUEUE_TIMEOUT = 30.0
+
+
+def warm():
+    return compile_source('void main(void) { }').ok
+
+
+def expire(signum, frame):
+    raise TimeoutError
+
+
+def work(source, options, cache=None, timeout=None, deadline=None):
+    if deadline is not None and time.time() > deadline:
+        raise TimeoutError('no worker was free in time')
+
+    start = time.perf_counter()
+    if timeout:
+        signal.signal(signal.SIGALRM, expire)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+
+    try:
+        if cache is None:
+            result = compile_source(source, **options).as_dict()
+        else:
+            from cache import Cache
+            result = Cache.shared(cache).compile(source, **options).as_dict()
+    finally:
+        if timeout:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+
+    result['time'] = round((time.perf_counter() - start) * 1000, 3)
+    return result
+
+
+class Server:
+
+    def __init__(self, workers=None, timeout=TIMEOUT, max_source=MAX_SOURCE, cache=None, queue_timeout=QUEUE_TIMEOUT):
+        self.timeout, self.max_source, self.cache = timeout, max_source, cache
+        self.queue_timeout = queue_timeout
+        self.workers = workers or os.cpu_count() or 1
+        self.pool = ProcessPoolExecutor(max_workers=self.workers, initializer=warm)
+        self.served = self.failed = 0
+
+    async def handle(self, line):
+        try:
+            request = json.loads(line)
+        except ValueError as error:
+            return {'id': None, 'error': F'bad request: {error}'}
+
+        if not isinstance(request, dict):
+            return {'id': None, 'error': 'bad request: expected an object'}
+
+        key, source = request.get('id'), request.get('source')
+        if request.get('ping'):
+            return {'id': key, 'pong': True}
+
+        if not isinstance(source, str):
+            return {'id': key, 'error': 'bad request: expected a "source" string'}
+
+        if len(source) > self.max_source:
+            self.failed += 1
+            return {'id': key, 'error': F'source too large: {len(source)} > {self.max_source} characters'}
+
+        options = {name: bool(request.get(name)) for name in ('tokens', 'symbol_table')}
+        future = self.pool.submit(work, source, options, self.cache, self.timeout, time.time() + self.queue_timeout)
+
+        try:
+            result = await asyncio.wait_for(asyncio.wrap_future(future), self.queue_timeout + self.timeout)
+        except (TimeoutError, asyncio.TimeoutError):
+            self.failed += 1
+            if future.done() and not future.cancelled() and not future.exception().args:
+                return {'id': key, 'error': F'timed out after {self.timeout}s'}
+            return {'id': key, 'error': F'waited more than {self.queue_timeout}s for a worker'}
+        except Exception as error:
+            self.failed += 1
+            return {'id': key, 'error': F'{type(error).__name__}: {error}'}
+
+        self.served += 1
+        result['id'] = key
+        return result
+
+    async def serve(self, reader, writer):
+        lock, pending = asyncio.Lock(), set()
+
+        async def reply(response):
+            async with lock:
+                writer.write(json.dumps(response).encode('utf-8') + b'\n')
+                await writer.drain()
+
+        async def respond(line):
+            await reply(await self.handle(line))
+
+        while True:
+            try:
+                line = await reader.readuntil(b'\n')
+            except asyncio.IncompleteReadError as error:
+                line = error.partial
+                if not line:
+                    break
+            except asyncio.LimitOverrunError:
+                self.failed += 1
+                await reply({'id': None, 'error': 'request too large'})
+                await self.skip(reader)
+                continue
+
+            if line.strip():
+                task = asyncio.ensure_future(respond(line))
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+
+        if pending:
+            await asyncio.gather(*pending)
+
+    @staticmethod
+    async def skip(reader):
+        while True:
+            try:
+                await reader.readuntil(b'\n')
+                return
+            except asyncio.IncompleteReadError:
+                return
+            except asyncio.LimitOverrunError as error:
+                await reader.readexactly(error.consumed)
+
+    async def stdio(self):
+        loop = asyncio.get_running_loop()
+
+        reader = asyncio.StreamReader(limit=self.max_source * 8)
+        await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), sys.stdin)
+
+        transport, protocol = await loop.connect_write_pipe(asyncio.streams.FlowControlMixin, sys.stdout)
+        writer = asyncio.StreamWriter(transport, protocol, reader, loop)
+
+        await self.serve(reader, writer)
+
+    async def connection(self, reader, writer):
+        try:
+            await self.serve(reader, writer)
+        finally:
+            writer.close()
+
+    async def unix(self, path):
+        if os.path.exists(path):
+            os.remove(path)
+
+        server = await asyncio.start_unix_server(self.connection, path, limit=self.max_source * 8)
+        async with server:
+            await server.serve_forever()
+
+    def start(self):
+        for future in [self.pool.submit(warm) for _ in range(self.workers)]:
+            future.result()
+
+    def close(self):
+        self.pool.shutdown(wait=False, cancel_futures=True)
+
+
+def main(argv=None):
+    arguments = argparse.ArgumentParser(description='Serve compile requests as JSON lines.')
+    arguments.add_argument('--socket', help='listen on this Unix socket instead of stdin/stdout')
+    arguments.add_argument('-j', '--workers', type=int, default=None, help='worker processes (default: all cores)')
+    arguments.add_argument('--timeout', type=float, default=TIMEOUT, help='seconds a request may spend compiling')
+    arguments.add_argument(
+        '--queue-timeout', type=float, default=QUEUE_TIMEOUT, help='seconds a request may wait for a free worker')
+    arguments.add_argument('--max-size', type=int, default=MAX_SOURCE, help='largest accepted source, in characters')
+    arguments.add_argument('--cache', help='directory of the compilation cache')
+    options = arguments.parse_args(argv)
+
+    server = Server(options.workers, options.timeout, options.max_size, options.cache, options.queue_timeout)
+    server.start()
+
+    try:
+        asyncio.run(server.unix(options.socket) if options.socket else server.stdio())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+        print(F'server: {server.served} served, {server.failed} failed', file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,232 @@
+import os
+import sys
+import hashlib
+
+VERSION = 1
+EPSILON = 'ε'
+MISSING, EOF, ILLEGAL = range(3)
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+GRAMMAR = os.path.join(HERE, 'grammar.txt')
+ACTIONS = os.path.join(HERE, 'actions.txt')
+TABLE = os.path.join(HERE, 'parse_table.py')
+
+
+class GrammarError(Exception):
+    pass
+
+
+def read(path):
+    with open(path, encoding='utf-8') as f:
+        return f.read()
+
+
+def digest(*texts):
+    return hashlib.sha1('\0'.join(texts).encode('utf-8')).hexdigest()
+
+
+def parse(text):
+    productions = {}
+
+    for line in filter(str.strip, text.splitlines()):
+        head, _, body = line.partition('->')
+        head = head.strip().lower()
+
+        if head in productions:
+            raise GrammarError(F'{head} is defined twice')
+
+        productions[head] = [alternative.split() for alternative in body.split('|')]
+
+    for alternatives in productions.values():
+        for path in alternatives:
+            for index, entry in enumerate(path):
+                if entry == 'EPSILON':
+                    path[index] = EPSILON
+                elif entry.lower() in productions and not entry.startswith('#'):
+                    path[index] = entry.lower()
+
+    return productions
+
+
+def symbols(path):
+    return [entry for entry in path if not entry.startswith('#')]
+
+
+def first_of(path, first):
+    result = set()
+
+    for entry in path:
+        if entry == EPSILON:
+            continue
+
+        if entry not in first:
+            result.add(entry)
+            return result
+
+        result.update(first[entry] - {EPSILON})
+        if EPSILON not in first[entry]:
+            return result
+
+    result.add(EPSILON)
+    return result
+
+
+def first_sets(grammar):
+    first = {head: set() for head in grammar}
+
+    changed = True
+    while changed:
+        changed = False
+
+        for head, alternatives in grammar.items():
+            for path in alternatives:
+                found = first_of(path, first)
+                if not found <= first[head]:
+                    first[head] |= found
+                    changed = True
+
+    return first
+
+
+def follow_sets(grammar, first):
+    follow = {head: set() for head in grammar}
+
+    changed = True
+    while changed:
+        changed = False
+
+        for head, alternatives in grammar.items():
+            for path in alternatives:
+                for index, entry in enumerate(path):
+                    if entry not in grammar:
+                        continue
+
+                    found = first_of(path[index + 1:], first)
+                    if EPSILON in found:
+                        found = (found - {EPSILON}) | follow[head]
+
+                    if not found <= follow[entry]:
+                        follow[entry] |= found
+                        changed = True
+
+    return follow
+
+
+def conflicts(grammar, first, follow):
+    for head, alternatives in grammar.items():
+        firsts = [first_of(path, first) for path in alternatives]
+
+        for i, a in enumerate(firsts):
+            for j, b in enumerate(firsts):
+                overlap = (a & b) - {EPSILON}
+                if i < j and overlap:
+                    yield F'{head}: alternatives {i + 1} and {j + 1} both start with {sorted(overlap)}'
+
+                if i < j and EPSILON in a and EPSILON in b:
+                    yield F'{head}: alternatives {i + 1} and {j + 1} are both nullable'
+
+                overlap = (a - {EPSILON}) & follow[head]
+                if i != j and EPSILON in b and overlap:
+                    yield F'{head}: alternative {i + 1} starts with {sorted(overlap)}, which can follow it'
+
+
+def drift(grammar, annotated):
+    if list(grammar) != list(annotated):
+        missing, extra = set(grammar) - set(annotated), set(annotated) - set(grammar)
+        yield F'nonterminals differ, missing {sorted(missing)}, extra {sorted(extra)}' \
+            if missing or extra else 'nonterminals are listed in a different order'
+
+    for head in grammar.keys() & annotated.keys():
+        expected = sorted(map(tuple, grammar[head]))
+        found = sorted(tuple(symbols(path)) for path in annotated[head])
+        if expected != found:
+            yield F'{head}: actions.txt has {found}, grammar.txt has {expected}'
+
+
+def generate(grammar_text, actions_text):
+    grammar, annotated = parse(grammar_text), parse(actions_text)
+
+    problems = list(drift(grammar, annotated))
+    first = first_sets(grammar)
+    follow = follow_sets(grammar, first)
+    problems += conflicts(grammar, first, follow)
+
+    if problems:
+        raise GrammarError('\n'.join(problems))
+
+    terminals = set().union(*first.values(), *follow.values()) - {EPSILON}
+    states = {}
+
+    for head, alternatives in annotated.items():
+        firsts = [first_of(symbols(path), first) for path in alternatives]
+        dispatch = {}
+
+        for terminal in sorted(terminals):
+            candidates = tuple(
+                index for index, found in enumerate(firsts)
+                if terminal in found or (terminal in follow[head] and EPSILON in found)
+            )
+            recovery = MISSING if terminal in follow[head] else EOF if terminal == '$' else ILLEGAL
+            if candidates or recovery != ILLEGAL:
+                dispatch[terminal] = candidates, recovery
+
+        states[head] = {
+            'paths': tuple(tuple(path) for path in alternatives),
+            'first': tuple(tuple(sorted(found)) for found in firsts),
+            'follow': tuple(sorted(follow[head])),
+            'dispatch': dispatch,
+        }
+
+    return states
+
+
+def write(states, key, path=TABLE):
+    lines = [
+        '# Generated by tablegen.py from grammar.txt and actions.txt, do not edit.',
+        F'VERSION = {VERSION}',
+        F'DIGEST = {key!r}',
+        'STATES = {',
+    ]
+
+    for head, state in states.items():
+        lines.append(F'    {head!r}: {{')
+        lines.extend(F'        {field!r}: {value!r},' for field, value in state.items())
+        lines.append('    },')
+
+    lines.append('}')
+
+    temp = F'{path}.{os.getpid()}.tmp'
+    with open(temp, 'w', encoding='utf-8') as f:
+        f.write('\n'.join(lines) + '\n')
+    os.replace(temp, path)
+
+
+def build(path=TABLE):
+    grammar_text, actions_text = read(GRAMMAR), read(ACTIONS)
+    states = generate(grammar_text, actions_text)
+    write(states, digest(grammar_text, actions_text), path)
+    return states
+
+
+def load():
+    try:
+        import parse_table
+    except ImportError:
+        parse_table = None
+
+    grammar_text, actions_text = read(GRAMMAR), read(ACTIONS)
+    if parse_table is not None and parse_table.VERSION == VERSION and \
+            parse_table.DIGEST == digest(grammar_text, actions_text):
+        return parse_table.STATES
+
+    print('tablegen: parse_table.py is missing or stale, run tablegen.py to regenerate it', file=sys.stderr)
+    return generate(grammar_text, actions_text)
+
+
+if __name__ == '__main__':
+    try:
+        states = build(sys.argv[1] if len(sys.argv) > 1 else TABLE)
+    except GrammarError as error:
+        sys.exit(F'tablegen: {error}')
+
+    print(F'tablegen: {len(states)} nonterminals written')
@@ -1,3 +1,17 @@
+import os
+import time
+import operator
+
+from heapq import heappush, heappop
+
+from cfg import Graph, transfer, solve
+from deadcode import DeadCode
+from peephole import Peephole, PATTERNS
+
+from ir import DIRECT, IMMEDIATE, INDIRECT
+from ir import Operand, Instruction, Placeholder, Program, PLACEHOLDER, direct, immediate, indirect, code, label
+from ir import ADD, SUB, MULT, EQ, LT, ASSIGN, JP, JPF, PRINT
+
 MACHINE_PARAMETER = 45000
 MACHINE_FUN_INDEX = 41000
 MACHINE_CONTAINER = 400
@@ -5,6 +19,13 @@ MACHINE_WORD_SIZE = 4
 
 COUNTER_REGISTER0 = 40000
 
+CONTAINER, COUNTER = direct[MACHINE_CONTAINER], direct[COUNTER_REGISTER0]
+
+FOLDS = {
+    ADD: operator.add, SUB: operator.sub, MULT: operator.mul,
+    LT: lambda a, b: int(a < b), EQ: lambda a, b: int(a == b)
+}
+
 
 class Register:
     rsp_temp = MACHINE_PARAMETER
@@ -109,29 +130,41 @@ class StackManager:
 
     def get_temporary(self): return self.reg.get_temporary()
 
+    def outermost(self, level):
+        activation = self.activation
+        for _ in range(level):
+            activation = activation.pro_parent
+        return activation.pro_parent is None
+
     def get_parameter(self): return self.reg.get_parameter() - self.rbp_proc
 
 
 class CodeGen:
-    def __init__(self, parser=None):
+    def __init__(self, parser=None, directory='.', peephole=PATTERNS):
+        self.directory = directory
         self.semantic_errors = []
         self.semantic_stack = []
-        self.program_block = []
+        self.program_block = Program()
         self.function_arg = []
         self.loops_stack = []
         self.func_stack = []
         self.fun_memory = None
         self.fun_refresh = []
+        self.frames, self.addresses = {}, {}
+        self.variables, self.entries = {}, []
         self.parser = parser
         self.functions_index = {}
         self.error_detected = False
+        self.finished = False
         self.stack_manager = StackManager()
+        self.statistics, self.timings = {'folded': 0, 'branches': 0}, {}
+        self.peephole = Peephole(peephole) if peephole else None
 
     def start_program(self):
         rbp = self.stack_manager.reg.rbp_container
 
-        self.program_block.append(F'(ASSIGN, #{rbp}, {MACHINE_CONTAINER})')
-        self.program_block.append(F'(ASSIGN, #{rbp}, {COUNTER_REGISTER0})')
+        self.program_block.append(ASSIGN, immediate[rbp], CONTAINER)
+        self.program_block.append(ASSIGN, immediate[rbp], COUNTER)
 
     def pid(self, lexeme=None):
 
@@ -149,8 +182,9 @@ class CodeGen:
                 self.semantic_stack.extend((None, None, None))
 
         elif row.el_type == 'arr':
-            address = self.indirect_address(level, row.address)[1:]
-            if self.fun_refresh:
+            address = self.indirect_address(level, row.address)
+            address = (direct if address.mode == INDIRECT else immediate)[address.value]
+            if self.fun_refresh and address.mode == DIRECT:
                 self.fun_refresh[-1].append((address, level, row.address))
             self.semantic_stack.extend((address, row.el_type, row.id_type))
 
@@ -161,26 +195,45 @@ class CodeGen:
         elif row.el_type != 'fun':
 
             address = self.indirect_address(level, row.address)
-            if self.fun_refresh:
+            self.variables[address] = row
+            if self.fun_refresh and address.mode == INDIRECT:
                 self.fun_refresh[-1].append((address, level, row.address))
             self.semantic_stack.extend((address, row.el_type, row.id_type))
 
     def indirect_address(self, level, address, temp_address=None):
+        if temp_address is None and self.stack_manager.outermost(level):
+            return direct[self.stack_manager.reg.rbp_container + address]
+
+        if temp_address is None and (level, address) in self.addresses:
+            return self.addresses[level, address]
 
         temp = temp_address or self.stack_manager.get_temporary()
-        self.program_block.append(F'(ASSIGN, {MACHINE_CONTAINER}, {temp})')
-        for _ in range(level):
-            self.program_block.append(F'(ADD, {temp}, #{3 * MACHINE_WORD_SIZE}, {temp})')
-            self.program_block.append(F'(ASSIGN, @{temp}, {temp})')
+        self.program_block.append(ADD, self.frame(level), immediate[address], direct[temp])
+
+        if temp_address is None:
+            self.addresses[level, address] = indirect[temp]
+        return indirect[temp]
+
+    def frame(self, level):
+        if level == 0:
+            return CONTAINER
 
-        self.program_block.append(F'(ADD, {temp}, #{address}, {temp})')
-        return F'@{temp}'
+        if level not in self.frames:
+            parent, temp = self.frame(level - 1), self.stack_manager.get_temporary()
+            self.program_block.append(ADD, parent, immediate[3 * MACHINE_WORD_SIZE], direct[temp])
+            self.program_block.append(ASSIGN, indirect[temp], direct[temp])
+            self.frames[level] = direct[temp]
+
+        return self.frames[level]
+
+    def invalidate(self):
+        self.frames.clear(), self.addresses.clear()
 
     def opera(self):
         op2_id_type = self.semantic_stack.pop()
         op2_el_type = self.semantic_stack.pop()
         op2_addr = self.semantic_stack.pop()
-        op = {'+': 'ADD', '-': 'SUB', '*': 'MULT', '<': 'LT', '==': 'EQ'}[self.semantic_stack.pop()]
+        op = {'+': ADD, '-': SUB, '*': MULT, '<': LT, '==': EQ}[self.semantic_stack.pop()]
         op1_id_type = self.semantic_stack.pop()
         op1_el_type = self.semantic_stack.pop()
         op1_addr = self.semantic_stack.pop()
@@ -203,9 +256,29 @@ class CodeGen:
             self.semantic_stack.extend((None, None, None))
 
         else:
-            address = self.stack_manager.get_temporary()
-            self.program_block.append(F"({op}, {op1_addr}, {op2_addr}, {address})")
-            self.semantic_stack.extend((address, op1_el_type, op1_id_type))
+            result = self.fold(op, op1_addr, op2_addr)
+            if result is None:
+                result = direct[self.stack_manager.get_temporary()]
+                self.program_block.append(op, op1_addr, op2_addr, result)
+            self.semantic_stack.extend((result, op1_el_type, op1_id_type))
+
+    def fold(self, op, a, b):
+        if getattr(a, 'mode', None) != IMMEDIATE or getattr(b, 'mode', None) != IMMEDIATE:
+            return None
+
+        value = FOLDS[op](a.value, b.value)
+        if not -1 << 31 <= value < 1 << 31:
+            return None
+
+        self.statistics['folded'] += 1
+        return immediate[value]
+
+    def branch(self, line, check, target):
+        if getattr(check, 'mode', None) != IMMEDIATE:
+            return Instruction(JPF, check, target)
+
+        self.statistics['branches'] += 1
+        return Instruction(JP, target if check.value == 0 else code[line + 1])
 
     def push(self):
         self.semantic_stack.append(self.parser.token.lexeme)
@@ -218,7 +291,7 @@ class CodeGen:
         self.error_detected = False
 
     def pnum(self):
-        self.semantic_stack.extend((F'#{self.parser.token.lexeme}', 'var', 'int'))
+        self.semantic_stack.extend((immediate[int(self.parser.token.lexeme)], 'var', 'int'))
 
     def assign(self):
         rhs_id_type = self.semantic_stack.pop()
@@ -249,7 +322,7 @@ class CodeGen:
             self.semantic_stack.extend((None, None, None))
 
         else:
-            self.program_block.append(F"(ASSIGN, {rhs_addr}, {lhs_addr})")
+            self.program_block.append(ASSIGN, rhs_addr, lhs_addr)
             self.semantic_stack.extend((lhs_addr, 'var', lhs_id_type))
 
     def declare(self, el_type='var', is_param=False):
@@ -271,9 +344,9 @@ class CodeGen:
             if not is_param:
                 self.pid(lexeme), self.semantic_stack.pop(), self.semantic_stack.pop()
                 lhs_addr = self.semantic_stack.pop()
-                self.program_block.append(F"(ASSIGN, #0, {lhs_addr})")
+                self.program_block.append(ASSIGN, immediate[0], lhs_addr)
 
-            self.program_block.append(F"(ADD, #4, {COUNTER_REGISTER0}, {COUNTER_REGISTER0})")
+            self.program_block.append(ADD, immediate[4], COUNTER, COUNTER)
 
     def dec_parr(self):
         self.declare('parr', True)
@@ -282,9 +355,11 @@ class CodeGen:
         self.declare('pvar', True)
 
     def start_scope(self):
+        self.invalidate()
         self.stack_manager.activation.deep_scope()
 
     def finish_scope(self):
+        self.invalidate()
         self.stack_manager.activation.high_scope()
 
     def dec_fun(self):
@@ -297,6 +372,7 @@ class CodeGen:
         mem.no_args = 0
         mem.address = self.stack_manager.get_parameter()
         mem.extra['line'] = len(self.program_block) + 2
+        self.entries.append(mem.extra['line'])
 
         self.func_stack.append([])
         self.fun_refresh.append([])
@@ -304,17 +380,16 @@ class CodeGen:
         pro_sbp = self.stack_manager.reg.rbp_container
 
         func_mom = MACHINE_FUN_INDEX + MACHINE_WORD_SIZE * self.functions_index[lexeme]
-        self.program_block.append(F'(ASSIGN, #{pro_sbp}, {func_mom})')
+        self.program_block.append(ASSIGN, immediate[pro_sbp], direct[func_mom])
 
         self.save()
-        self.program_block.append(
-            F"(ADD, #{4 * MACHINE_WORD_SIZE}, {COUNTER_REGISTER0}, {COUNTER_REGISTER0})")
+        self.program_block.append(ADD, immediate[4 * MACHINE_WORD_SIZE], COUNTER, COUNTER)
         self.stack_manager.deep_activation(mem)
 
     def end_func(self):
 
         for line in self.func_stack.pop():
-            self.program_block[line] = F'(JP, {len(self.program_block)})'
+            self.program_block[line] = Instruction(JP, code[len(self.program_block)])
 
         self.back()
         self.stack_manager.high_activation()
@@ -323,8 +398,8 @@ class CodeGen:
 
     def back(self):
         temp = self.stack_manager.get_temporary()
-        self.program_block.append(F'(ASSIGN, @{MACHINE_CONTAINER}, {temp})')
-        self.program_block.append(F'(JP, @{temp})')
+        self.program_block.append(ASSIGN, indirect[MACHINE_CONTAINER], direct[temp])
+        self.program_block.append(JP, indirect[temp])
 
     def dec_arr(self):
         s_num = self.semantic_stack.pop()
@@ -346,14 +421,13 @@ class CodeGen:
             mem.address = all_address[0]
 
             orig, temp = self.stack_manager.get_temporary(), self.stack_manager.get_temporary()
-            self.program_block.append(F"(ASSIGN, {MACHINE_CONTAINER}, {orig})")
+            self.program_block.append(ASSIGN, CONTAINER, direct[orig])
 
             for addr in all_address:
-                self.program_block.append(F"(ADD, {orig}, #{addr}, {temp})")
-                self.program_block.append(F"(ASSIGN, #0, @{temp})")
+                self.program_block.append(ADD, direct[orig], immediate[addr], direct[temp])
+                self.program_block.append(ASSIGN, immediate[0], indirect[temp])
 
-            self.program_block.append(
-                F"(ADD, #{len(all_address) * MACHINE_WORD_SIZE}, {COUNTER_REGISTER0}, {COUNTER_REGISTER0})")
+            self.program_block.append(ADD, immediate[len(all_address) * MACHINE_WORD_SIZE], COUNTER, COUNTER)
 
     def parr(self):
         idn_id_type = self.semantic_stack.pop()
@@ -370,33 +444,44 @@ class CodeGen:
             self.semantic_stack.extend((None, None, None))
 
         else:
+            offset = self.fold(MULT, num_ind, immediate[MACHINE_WORD_SIZE])
+            element = None if offset is None else self.fold(ADD, address, offset)
+            if element is not None:
+                self.semantic_stack.extend((direct[element.value], 'var', arr_id_type))
+                return
+
             temp = self.stack_manager.get_temporary()
-            self.program_block.append(F"(MULT, {num_ind}, #{MACHINE_WORD_SIZE}, {temp})")
-            self.program_block.append(F"(ADD, {address}, {temp}, {temp})")
-            self.semantic_stack.extend((F'@{temp}', 'var', arr_id_type))
+            if offset is None:
+                offset = direct[temp]
+                self.program_block.append(MULT, num_ind, immediate[MACHINE_WORD_SIZE], offset)
+            self.program_block.append(ADD, address, offset, direct[temp])
+            self.semantic_stack.extend((indirect[temp], 'var', arr_id_type))
 
     def label(self):
+        self.invalidate()
         self.semantic_stack.append(len(self.program_block))
 
     def save(self):
         self.label()
-        self.program_block.append('saved!')
+        self.program_block.add(Placeholder(Placeholder.SAVED))
 
     def fill_jpf(self):
         line = self.semantic_stack.pop()
         _, _, check = self.semantic_stack.pop(), self.semantic_stack.pop(), self.semantic_stack.pop()
 
-        self.program_block[line] = F'(JPF, {check}, {len(self.program_block)})'
+        self.invalidate()
+        self.program_block[line] = self.branch(line, check, code[len(self.program_block)])
 
     def fill_jp(self):
         ind = self.semantic_stack.pop()
-        self.program_block[ind] = F'(JP, {len(self.program_block)})'
+        self.invalidate()
+        self.program_block[ind] = Instruction(JP, code[len(self.program_block)])
 
     def ifc_action(self):
         ind = self.semantic_stack.pop()
         _ = self.semantic_stack.pop()
         _ = self.semantic_stack.pop()
-        self.program_block[ind] = F'(JPF, {self.semantic_stack.pop()}, {len(self.program_block) + 1})'
+        self.program_block[ind] = self.branch(ind, self.semantic_stack.pop(), code[len(self.program_block) + 1])
         self.save()
 
     def function_return(self):
@@ -407,13 +492,14 @@ class CodeGen:
             return
 
         temp = self.stack_manager.get_temporary()
-        self.program_block.append(F'(ADD, {MACHINE_CONTAINER}, #{MACHINE_WORD_SIZE}, {temp})')
-        self.program_block.append(F'(ASSIGN, {addr}, @{temp})')
+        self.program_block.append(ADD, CONTAINER, immediate[MACHINE_WORD_SIZE], direct[temp])
+        self.program_block.append(ASSIGN, addr, indirect[temp])
 
     def scope_break(self):
+        self.invalidate()
         if len(self.loops_stack):
             self.loops_stack[-1].append(len(self.program_block))
-            self.program_block.append('break')
+            self.program_block.add(Placeholder(Placeholder.BREAK))
         else:
             self.semantic_errors.append(
                 F"#{self.parser.lineno} : Semantic Error! No 'repeat ... until' found for 'break'.")
@@ -424,10 +510,15 @@ class CodeGen:
         _, _, address = self.semantic_stack.pop(), self.semantic_stack.pop(), self.semantic_stack.pop(),
         line = self.semantic_stack.pop()
 
-        self.program_block.append(F'(JPF, {address}, {line})')
+        if getattr(address, 'mode', None) == IMMEDIATE and address.value:
+            self.statistics['branches'] += 1
+            self.statistics['folded'] += 1
+        else:
+            self.program_block.add(self.branch(len(self.program_block), address, code[line]))
 
+        self.invalidate()
         for line in self.loops_stack.pop():
-            self.program_block[line] = F'(JP, {len(self.program_block)})'
+            self.program_block[line] = Instruction(JP, code[len(self.program_block)])
 
     def loop(self):
         self.label()
@@ -443,7 +534,7 @@ class CodeGen:
                 self.semantic_errors.append(
                     F'#{self.parser.lineno} : Semantic Error! Mismatch in numbers of arguments of output.')
             else:
-                self.program_block.append(F'(PRINT, {self.function_arg[0][0]})')
+                self.program_block.append(PRINT, self.function_arg[0][0])
 
             self.semantic_stack.extend((None, None, None))
             self.error_detected = True
@@ -480,8 +571,12 @@ class CodeGen:
         else:
 
             self.semantic_stack.extend((self.call_function(lexeme), 'var', self.fun_memory.id_type))
+
+            pending = set(map(id, self.semantic_stack))
+            entries = {id(entry[0]): entry for entry in self.fun_refresh[-1] if id(entry[0]) in pending}
+            self.fun_refresh[-1][:] = entries.values()
             for at_address, level, row_address in self.fun_refresh[-1]:
-                self.indirect_address(level, row_address, at_address[1:])
+                self.indirect_address(level, row_address, at_address.value)
 
         self.function_arg.clear()
 
@@ -490,40 +585,41 @@ class CodeGen:
         jump, address = self.fun_memory.extra["line"], self.stack_manager.get_temporary()
         x = len(self.program_block) + 2 * len(self.function_arg) + 11
 
-        self.program_block.append(F'(ASSIGN, {COUNTER_REGISTER0}, {address})')
+        self.program_block.append(ASSIGN, COUNTER, direct[address])
 
         temp = self.stack_manager.get_temporary()
 
-        self.program_block.append(F'(ADD, {address}, #{0 * MACHINE_WORD_SIZE}, {temp})')
-        self.program_block.append(F'(ASSIGN, #{x}, @{temp})')
+        self.program_block.append(ADD, direct[address], immediate[0 * MACHINE_WORD_SIZE], direct[temp])
+        self.program_block.append(ASSIGN, label[x], indirect[temp])
 
-        self.program_block.append(F'(ADD, {address}, #{1 * MACHINE_WORD_SIZE}, {temp})')
-        self.program_block.append(F'(ASSIGN, #0, @{temp})')
+        self.program_block.append(ADD, direct[address], immediate[1 * MACHINE_WORD_SIZE], direct[temp])
+        self.program_block.append(ASSIGN, immediate[0], indirect[temp])
 
-        self.program_block.append(F'(ADD, {address}, #{2 * MACHINE_WORD_SIZE}, {temp})')
-        self.program_block.append(F'(ASSIGN, {MACHINE_CONTAINER}, @{temp})')
+        self.program_block.append(ADD, direct[address], immediate[2 * MACHINE_WORD_SIZE], direct[temp])
+        self.program_block.append(ASSIGN, CONTAINER, indirect[temp])
 
         func_mom = MACHINE_FUN_INDEX + MACHINE_WORD_SIZE * self.functions_index[lexeme]
 
-        self.program_block.append(F'(ADD, {address}, #{3 * MACHINE_WORD_SIZE}, {temp})')
-        self.program_block.append(F'(ASSIGN, {func_mom}, @{temp})')
+        self.program_block.append(ADD, direct[address], immediate[3 * MACHINE_WORD_SIZE], direct[temp])
+        self.program_block.append(ASSIGN, direct[func_mom], indirect[temp])
 
         for addr, el_type, id_type in self.function_arg:
-            self.program_block.append(F'(ADD, {temp}, #{MACHINE_WORD_SIZE}, {temp})')
-            self.program_block.append(F'(ASSIGN, {addr}, @{temp})')
+            self.program_block.append(ADD, direct[temp], immediate[MACHINE_WORD_SIZE], direct[temp])
+            self.program_block.append(ASSIGN, addr, indirect[temp])
 
-        self.program_block.append(F'(ASSIGN, {address}, {MACHINE_CONTAINER})')
+        self.program_block.append(ASSIGN, direct[address], CONTAINER)
 
-        self.program_block.append(F'(JP, {jump})')
+        self.program_block.append(JP, code[jump])
+        self.invalidate()
 
         result = self.stack_manager.get_temporary()
-        self.program_block.append(F'(ADD, {MACHINE_CONTAINER}, #{MACHINE_WORD_SIZE * 1}, {result})')
-        self.program_block.append(F'(ASSIGN, @{result}, {result})')
+        self.program_block.append(ADD, CONTAINER, immediate[MACHINE_WORD_SIZE * 1], direct[result])
+        self.program_block.append(ASSIGN, indirect[result], direct[result])
 
         temp = self.stack_manager.get_temporary()
-        self.program_block.append(F'(ADD, {MACHINE_CONTAINER}, #{2 * MACHINE_WORD_SIZE}, {temp})')
-        self.program_block.append(F'(ASSIGN, @{temp}, {MACHINE_CONTAINER})')
-        return result
+        self.program_block.append(ADD, CONTAINER, immediate[2 * MACHINE_WORD_SIZE], direct[temp])
+        self.program_block.append(ASSIGN, indirect[temp], CONTAINER)
+        return direct[result]
 
     def add_args(self):
         x3, x2, x1 = \
@@ -532,10 +628,10 @@ class CodeGen:
         self.function_arg.append((x1, x2, x3))
 
     def fun_return(self):
-
+        self.invalidate()
         if len(self.func_stack):
             self.func_stack[-1].append(len(self.program_block))
-            self.program_block.append('return')
+            self.program_block.add(Placeholder(Placeholder.RETURN))
         else:
             self.semantic_errors.append(
                 F"#{self.parser.lineno}: Semantic Error! No 'function' found for 'return'.")
@@ -546,15 +642,95 @@ class CodeGen:
 
         level, self.fun_memory = self.stack_manager.activation.get_variable('main')
         self.call_function('main')
+        self.finished = True
 
-        with open('output.txt', 'w') as f:
-            if self.semantic_errors:
-                f.write('The code has not been generated.')
-            else:
-                f.writelines([F'{i}\t{x}\n' for i, x in enumerate(self.program_block)])
+        if not self.semantic_errors:
+            temporaries = range(MACHINE_PARAMETER, self.stack_manager.reg.rsp_temp)
+            slots = range(
+                MACHINE_FUN_INDEX, MACHINE_FUN_INDEX + MACHINE_WORD_SIZE * len(self.entries), MACHINE_WORD_SIZE
+            )
 
-        with open('semantic_errors.txt', 'w') as f:
-            if self.semantic_errors:
-                f.writelines([F'{x}\n' for x in self.semantic_errors])
-            else:
-                f.write('The input program is semantically correct.')
\ No newline at end of file
+            dead_code = DeadCode()
+            self.timed('dead_code', dead_code.run, self.program_block, self.entries, slots, self.variables, temporaries)
+            self.statistics['dead_code'] = dead_code.statistics
+
+            if self.peephole:
+                self.timed('peephole', self.peephole.run, self.program_block, temporaries)
+                self.statistics['peephole'] = self.peephole.statistics
+
+            pinned = None if PLACEHOLDER in self.program_block.ops else self.live_temporaries(temporaries)
+            self.timed('allocate', self.allocate_temporaries, pinned)
+            self.statistics['timings'] = self.timings
+
+        if self.directory is not None:
+            self.write(self.directory)
+
+    def timed(self, name, function, *args):
+        start = time.perf_counter()
+        result = function(*args)
+        self.timings[name] = self.timings.get(name, 0) + time.perf_counter() - start
+        return result
+
+    def live_temporaries(self, temporaries):
+        graph = self.timed('graph', Graph, self.program_block)
+        problems = list(graph.check())
+        if problems:
+            self.statistics['cfg_problems'] = problems
+            return None
+
+        bits, gen, kill = self.timed('transfer', transfer, graph, temporaries)
+        inputs, _ = self.timed('liveness', solve, graph, gen, kill, False)
+
+        live = 0
+        for value in inputs:
+            live |= value
+
+        return {temp for temp, bit in bits.items() if bit & live}
+
+    def allocate_temporaries(self, pinned=None):
+        bottom, operands = MACHINE_PARAMETER, self.program_block.operands
+        first, last, crossing = self.program_block.intervals(range(bottom, self.stack_manager.reg.rsp_temp))
+        pinned = crossing if pinned is None else pinned
+
+        mapping, free, ends, address = {}, [], [], bottom
+        for temp in sorted(first, key=first.get):
+            if temp not in pinned:
+                while ends and ends[0][0] < first[temp]:
+                    heappush(free, heappop(ends)[1])
+
+                if free:
+                    mapping[temp] = heappop(free)
+                    heappush(ends, (last[temp], mapping[temp]))
+                    continue
+
+                heappush(ends, (last[temp], address))
+
+            mapping[temp], address = address, address + MACHINE_WORD_SIZE
+
+        tables = {DIRECT: direct, INDIRECT: indirect}
+        for index, operand in enumerate(operands):
+            if operand.__class__ is Operand and operand.mode in tables and operand.value in mapping:
+                operands[index] = tables[operand.mode][mapping[operand.value]]
+
+        self.stack_manager.reg.rsp_temp = address
+
+    @staticmethod
+    def format_output(program_block, semantic_errors):
+        if semantic_errors:
+            return 'The code has not been generated.'
+
+        return ''.join([F'{i}\t{x}\n' for i, x in enumerate(program_block.lines())])
+
+    @staticmethod
+    def format_semantic_errors(semantic_errors):
+        if semantic_errors:
+            return ''.join([F'{x}\n' for x in semantic_errors])
+
+        return 'The input program is semantically correct.'
+
+    def write(self, directory):
+        with open(os.path.join(directory, 'output.txt'), 'w') as f:
+            f.write(self.format_output(self.program_block, self.semantic_errors))
+
+        with open(os.path.join(directory, 'semantic_errors.txt'), 'w') as f:
+            f.write(self.format_semantic_errors(self.semantic_errors))
@@ -0,0 +1,188 @@
+import sys
+import time
+import argparse
+
+from array import array
+
+import toMC
+import binary
+
+from ir import Instruction, NAMES, IMMEDIATE, INDIRECT, CODE, LABEL
+from ir import ADD, SUB, MULT, EQ, LT, ASSIGN, JP, PRINT
+SYMBOLS = {ADD: '+', SUB: '-', MULT: '*', EQ: '==', LT: '<'}
+
+STACK_WORDS = 1 << 16
+MAX_STEPS = 1 << 24
+
+
+class VMError(Exception):
+    pass
+
+
+def fault(pc, address):
+    if address & 3:
+        raise VMError(F'{pc}: address {address} is not word aligned')
+
+    raise VMError(F'{pc}: address {address} is outside memory')
+
+
+class VM:
+
+    def __init__(self, program_block, memory_words=None, max_steps=MAX_STEPS):
+        self.max_steps = max_steps
+        self.decode(program_block)
+
+        addresses = (value for mode, value in zip(self.modes, self.values) if mode not in (IMMEDIATE, CODE, LABEL))
+        highest = max(addresses, default=0)
+        words = memory_words or (max(highest, toMC.MACHINE_PARAMETER) >> 2) + STACK_WORDS
+        self.memory_words = 1 << (words - 1).bit_length()
+        self.mask = ~((self.memory_words << 2) - 1) | 3
+        self.reset()
+
+    @classmethod
+    def from_listing(cls, text, **options):
+        return cls([line.split('\t', 1)[-1] for line in text.splitlines() if line.strip()], **options)
+
+    def decode(self, program_block):
+        self.opcodes = array('B')
+        self.modes = array('B', bytes(3 * len(program_block)))
+        self.values = array('q', bytes(24 * len(program_block)))
+
+        for pc, instruction in enumerate(program_block):
+            if isinstance(instruction, str):
+                try:
+                    instruction = Instruction.parse(instruction)
+                except ValueError as error:
+                    raise VMError(F'{pc}: {error}') from None
+
+            if not isinstance(instruction, Instruction):
+                raise VMError(F'{pc}: unfilled placeholder {instruction}')
+
+            self.opcodes.append(instruction.op)
+            for index, operand in enumerate(instruction.operands):
+                if operand is None:
+                    raise VMError(F'{pc}: {NAMES[instruction.op]} has a missing operand')
+
+                if operand.mode not in (IMMEDIATE, CODE, LABEL) and operand.value & 3:
+                    raise VMError(F'{pc}: address {operand.value} is not word aligned')
+
+                self.modes[3 * pc + index], self.values[3 * pc + index] = operand.mode, operand.value
+
+    def reset(self):
+        self.memory = [0] * self.memory_words
+        self.blocks = [None] * len(self.opcodes)
+        self.output, self.steps, self.pc = [], 0, 0
+
+    def operand(self, pc, index):
+        mode, value = self.modes[3 * pc + index], self.values[3 * pc + index]
+
+        if mode == IMMEDIATE or mode == LABEL:
+            return str(value)
+
+        if mode == INDIRECT:
+            return F'm[a >> 2 if not (a := m[{value >> 2}]) & {self.mask} else fault({pc}, a)]'
+
+        return F'm[{value >> 2}]'
+
+    def target(self, pc, index):
+        mode, value = self.modes[3 * pc + index], self.values[3 * pc + index]
+        return F'm[{value >> 2}]' if mode == INDIRECT else str(value)
+
+    def destination(self, pc, index):
+        if self.modes[3 * pc + index] in (IMMEDIATE, LABEL):
+            raise VMError(F'{pc}: cannot store into an immediate')
+
+        return self.operand(pc, index)
+
+    def compile(self, start):
+        lines, pc, size = ['def block(m):'], start, len(self.opcodes)
+
+        while pc < size:
+            opcode = self.opcodes[pc]
+
+            if opcode in SYMBOLS:
+                expression = F'{self.operand(pc, 0)} {SYMBOLS[opcode]} {self.operand(pc, 1)}'
+                if opcode in (EQ, LT):
+                    expression = F'1 if {expression} else 0'
+                lines.append(F'    {self.destination(pc, 2)} = {expression}')
+            elif opcode == ASSIGN:
+                lines.append(F'    {self.destination(pc, 1)} = {self.operand(pc, 0)}')
+            elif opcode == PRINT:
+                lines.append(F'    emit({self.operand(pc, 0)})')
+            elif opcode == JP:
+                lines.append(F'    return {self.target(pc, 0)}')
+                break
+            else:
+                lines.append(F'    return {pc + 1} if {self.operand(pc, 0)} else {self.target(pc, 1)}')
+                break
+
+            pc += 1
+        else:
+            lines.append(F'    return {pc}')
+
+        namespace = {'emit': self.output.append, 'fault': fault}
+        exec('\n'.join(lines), namespace)
+        self.blocks[start] = namespace['block'], min(pc + 1, size) - start
+        return self.blocks[start]
+
+    def run(self):
+        blocks, memory, size = self.blocks, self.memory, len(self.opcodes)
+        pc, steps, limit = self.pc, self.steps, self.max_steps
+
+        try:
+            while 0 <= pc < size:
+                block, length = blocks[pc] or self.compile(pc)
+                steps += length
+                if steps > limit:
+                    raise VMError(F'{pc}: gave up after {limit} instructions')
+                pc = block(memory)
+        except IndexError as error:
+            raise VMError(F'{pc}: {error}') from None
+        finally:
+            self.pc, self.steps = pc, steps
+
+        if pc != size:
+            raise VMError(F'jump to {pc} outside the program')
+
+        return self.output
+
+    def text(self):
+        return ''.join(F'PRINT\t{value}\n' for value in self.output)
+
+
+def main(argv=None):
+    arguments = argparse.ArgumentParser(description='Run three address code.')
+    arguments.add_argument(
+        'input', nargs='?', default='output.txt', help='a listing or object file, or a source file with --compile')
+    arguments.add_argument('-c', '--compile', action='store_true', help='compile the input before running it')
+    arguments.add_argument('--max-steps', type=int, default=MAX_STEPS, help='stop after this many instructions')
+    options = arguments.parse_args(argv)
+
+    if not options.compile and binary.is_object(options.input):
+        vm = VM(binary.load(options.input), max_steps=options.max_steps)
+    elif options.compile:
+        from compiler import compile_source
+        with open(options.input, encoding='utf-8') as f:
+            result = compile_source(f.read())
+        if not result.ok:
+            sys.exit(F'vm: {options.input} does not compile')
+        vm = VM(result.program_block, max_steps=options.max_steps)
+    else:
+        with open(options.input, encoding='utf-8') as f:
+            vm = VM.from_listing(f.read(), max_steps=options.max_steps)
+
+    start = time.perf_counter()
+    try:
+        vm.run()
+    except VMError as error:
+        sys.exit(F'vm: {error}')
+    finally:
+        elapsed = time.perf_counter() - start
+        sys.stdout.write(vm.text())
+
+    print(F'vm: {vm.steps} instructions in {elapsed:.3f}s ({vm.steps / max(elapsed, 1e-9) / 1e6:.1f} M/s)',
+          file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+import binary
+from cache import Cache
+from compiler import compile_source
+from ir import Placeholder, Program, LABEL
+
+CALLS = '''
+int square(int x) {
+    return x * x;
+}
+void main(void) {
+    int i;
+    i = 0;
+    repeat {
+        output(square(i));
+        i = i + 1;
+    } until (2 < i)
+}
+'''
+MISUSED = 'void main(void){ output(output); }'
+
+
+class CacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def assertSameProgram(self, source):
+        expected = compile_source(source)
+        cache = Cache(self.directory.name)
+        first, second = cache.compile(source), cache.compile(source)
+        self.assertEqual((cache.misses, cache.hits), (1, 1))
+
+        for result in (first, second):
+            self.assertEqual(result.output, expected.output)
+            self.assertEqual(list(result.program_block.ops), list(expected.program_block.ops))
+            self.assertEqual(result.program_block.pairs(), expected.program_block.pairs())
+            self.assertEqual(
+                [type(operand) for operand in result.program_block.operands],
+                [type(operand) for operand in expected.program_block.operands]
+            )
+
+        return expected, second
+
+    def test_labels_survive_a_hit(self):
+        expected, hit = self.assertSameProgram(CALLS)
+        self.assertIn(LABEL, [pair[0] for pair in hit.program_block.pairs() if isinstance(pair, list)])
+        self.assertEqual(binary.dumps(hit.program_block), binary.dumps(expected.program_block))
+
+    def test_raw_operands_survive_a_hit(self):
+        self.assertSameProgram(MISUSED)
+
+    def test_placeholders_survive_a_restore(self):
+        program = Program.parse(['(ASSIGN, #1, 500)', 'break', '(JP, @500)'])
+        restored = Program.restore(program.ops, program.pairs())
+        self.assertIsInstance(restored[1], Placeholder)
+        self.assertEqual(restored.lines(), program.lines())
+
+
+if __name__ == '__main__':
+    unittest.main()